@@ -30,7 +30,7 @@ from .const import (
     RingLedType,
     ColorOrder,
     EffectType,
-    get_device_capabilities,
+    resolve_device,
 )
 from .device import LEDNetWFDevice
 from .capabilities import CAPABILITIES
@@ -76,7 +76,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Store LED settings from options in device state
     # These will be sent to the device when needed
-    caps = get_device_capabilities(product_id)
+    caps = resolve_device(product_id).caps
     if caps.get("has_ic_config"):
         device._led_count = entry.options.get(CONF_LED_COUNT, DEFAULT_LED_COUNT)
         device._segments = entry.options.get(CONF_SEGMENTS, DEFAULT_SEGMENTS)
@@ -111,18 +111,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = device
 
-    # Register Bluetooth callback for advertisement updates
+    # Register Bluetooth callback for advertisement updates.
+    # Runs at advertisement rate, so bind the device method once up front.
+    update_from_advertisement = device.update_from_advertisement
+
     @callback
     def _async_update_ble(
         service_info: BluetoothServiceInfoBleak,
         change: BluetoothChange,
     ) -> None:
         """Handle Bluetooth advertisement updates."""
-        if service_info.manufacturer_data or service_info.service_data:
-            device.update_from_advertisement(
-                service_info.manufacturer_data,
-                service_info.service_data,
-            )
+        manufacturer_data = service_info.manufacturer_data
+        service_data = service_info.service_data
+        if manufacturer_data or service_data:
+            update_from_advertisement(manufacturer_data, service_data)
 
     entry.async_on_unload(
         async_register_callback(
@@ -172,7 +174,7 @@ async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None
 
     # Check if LED settings need to be applied
     product_id = entry.data.get(CONF_PRODUCT_ID)
-    caps = get_device_capabilities(product_id)
+    caps = resolve_device(product_id).caps
 
     if device.is_iotbt_segment:
         # IOTBT segment lamps: only LEDs-per-segment and segment count apply,
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping
 
 import voluptuous as vol
 
@@ -46,33 +49,199 @@ from .const import (
     ColorOrder,
     SimpleColorOrder,
     EffectType,
-    is_supported_device,
-    get_device_capabilities,
-    needs_capability_probing,
+    resolve_device,
 )
-from .device import LEDNetWFDevice
 from . import protocol
 
+if TYPE_CHECKING:
+    from .device import LEDNetWFDevice
+
 _LOGGER = logging.getLogger(__name__)
 
 
+# Lowercased device name prefixes accepted by _is_valid_device_name
+_VALID_NAME_PREFIXES = ("lednetwf", "iotwf", "iotb")
+
+# Static schema parts, built once at import rather than on every form render
+_CONFIRM_SCHEMA = vol.Schema({vol.Required("test_device", default=True): bool})
+_DISCONNECT_DELAY_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=5, max=300))
+_LED_COUNT_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=1, max=1000, mode=NumberSelectorMode.BOX)
+)
+_SEGMENTS_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=1, max=100, mode=NumberSelectorMode.BOX)
+)
+# Ring and IOTBT segment devices carry LED count / segments in a single byte
+_BYTE_COUNT_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=1, max=255, mode=NumberSelectorMode.BOX)
+)
+_IOTBT_PROTOCOL_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(IOTBT_PROTOCOL_CHOICES),
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+
+# Enum choices for the LED option selectors, and value -> name for their defaults
+_LED_TYPE_NAMES = tuple(t.name for t in LedType)
+_RING_LED_TYPE_NAMES = tuple(t.name for t in RingLedType)
+_COLOR_ORDER_NAMES = tuple(o.name for o in ColorOrder)
+_SIMPLE_COLOR_ORDER_NAMES = tuple(o.name for o in SimpleColorOrder)
+_LED_TYPE_BY_VALUE = {t.value: t.name for t in LedType}
+_RING_LED_TYPE_BY_VALUE = {t.value: t.name for t in RingLedType}
+_COLOR_ORDER_BY_VALUE = {o.value: o.name for o in ColorOrder}
+_SIMPLE_COLOR_ORDER_BY_VALUE = {o.value: o.name for o in SimpleColorOrder}
+_LED_TYPE_VALIDATOR = vol.In(_LED_TYPE_NAMES)
+_RING_LED_TYPE_VALIDATOR = vol.In(_RING_LED_TYPE_NAMES)
+_COLOR_ORDER_VALIDATOR = vol.In(_COLOR_ORDER_NAMES)
+_SIMPLE_COLOR_ORDER_VALIDATOR = vol.In(_SIMPLE_COLOR_ORDER_NAMES)
+
+# Seconds a user-step scan is reused before async_discovered_service_info is walked again
+_USER_SCAN_MAX_AGE = 5.0
+
+# Device test pattern steps (see _async_show_test_pattern)
+_TEST_PATTERN_RGB = ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+_TEST_PATTERN_KELVIN = (2700, 4600, 6500)
+
+
+@dataclass(slots=True)
+class _DiscoveryInfo:
+    """A discovered device, plus what the device test learned about it."""
+
+    address: str
+    name: str
+    product_id: int | None
+    fw_version: str | None = None
+    rssi: int | None = None
+    probed_capabilities: dict | None = None
+    queried_led_settings: dict | None = None
+    queried_color_order: int | None = None
+
+
+@lru_cache(maxsize=256)
+def _format_mac(address: str) -> str:
+    """format_mac, cached since the same addresses recur across scans."""
+    return format_mac(address)
+
+
+def _addressable_led_schema(
+    led_count: int, segments: int, led_type: int | None, color_order: int | None
+) -> dict[vol.Marker, Any]:
+    """LED options for addressable strips (has_ic_config), defaults given as values."""
+    return {
+        vol.Optional(CONF_LED_COUNT, default=led_count): _LED_COUNT_SELECTOR,
+        vol.Optional(CONF_SEGMENTS, default=segments): _SEGMENTS_SELECTOR,
+        vol.Optional(
+            CONF_LED_TYPE,
+            default=_LED_TYPE_BY_VALUE.get(led_type, LedType.WS2812B.name),
+        ): _LED_TYPE_VALIDATOR,
+        vol.Optional(
+            CONF_COLOR_ORDER,
+            default=_COLOR_ORDER_BY_VALUE.get(color_order, ColorOrder.GRB.name),
+        ): _COLOR_ORDER_VALIDATOR,
+    }
+
+
+def _ring_led_schema(
+    led_count: int, led_type: int | None, color_order: int | None
+) -> dict[vol.Marker, Any]:
+    """LED options for Ring / FillLight (ADDRESSABLE_0x53) devices.
+
+    These support a single segment only, so there is no segments field, and the
+    chip type uses the ring-specific RingLedType numbering.
+    """
+    return {
+        vol.Optional(CONF_LED_COUNT, default=led_count): _BYTE_COUNT_SELECTOR,
+        vol.Optional(
+            CONF_LED_TYPE,
+            default=_RING_LED_TYPE_BY_VALUE.get(led_type, RingLedType.WS2812B.name),
+        ): _RING_LED_TYPE_VALIDATOR,
+        vol.Optional(
+            CONF_COLOR_ORDER,
+            default=_COLOR_ORDER_BY_VALUE.get(color_order, ColorOrder.GRB.name),
+        ): _COLOR_ORDER_VALIDATOR,
+    }
+
+
+def _simple_color_order_schema(color_order: int | None) -> dict[vol.Marker, Any]:
+    """Colour order option for SIMPLE devices (0x33, etc.) - only RGB, GRB, BRG."""
+    return {
+        vol.Optional(
+            CONF_COLOR_ORDER,
+            default=_SIMPLE_COLOR_ORDER_BY_VALUE.get(
+                color_order, SimpleColorOrder.GRB.name
+            ),
+        ): _SIMPLE_COLOR_ORDER_VALIDATOR,
+    }
+
+
+def _convert_led_options(
+    user_input: dict[str, Any], caps: Mapping[str, Any], is_ring: bool
+) -> dict[str, Any]:
+    """Convert submitted LED options to stored values (enum names -> values)."""
+    converted: dict[str, Any] = {}
+    for key in (CONF_LED_COUNT, CONF_SEGMENTS):
+        if key in user_input:
+            converted[key] = int(user_input[key])
+    if CONF_LED_TYPE in user_input:
+        # Ring / FillLight devices use the ring-specific chip-type numbering.
+        led_type_enum = RingLedType if is_ring else LedType
+        converted[CONF_LED_TYPE] = led_type_enum[user_input[CONF_LED_TYPE]].value
+    if CONF_COLOR_ORDER in user_input:
+        # SIMPLE devices use SimpleColorOrder, addressable/Symphony use ColorOrder
+        color_order_enum = (
+            SimpleColorOrder
+            if caps.get("has_color_order") and not caps.get("has_ic_config")
+            else ColorOrder
+        )
+        converted[CONF_COLOR_ORDER] = color_order_enum[user_input[CONF_COLOR_ORDER]].value
+    return converted
+
+
+async def _async_show_test_pattern(device: LEDNetWFDevice) -> None:
+    """Flash a capability-appropriate test pattern, leaving the device off.
+
+    The sleeps keep each step visible long enough for the user to confirm it.
+    """
+    await device.turn_on()
+    await asyncio.sleep(0.3)
+
+    if device.has_rgb:
+        # RGB devices: Show R-G-B test pattern at full brightness
+        # Easily distinguishable from effects and confirms color control
+        for color in _TEST_PATTERN_RGB:
+            await device.set_rgb_color(color, brightness=255)
+            await asyncio.sleep(0.7)
+    elif device.has_color_temp:
+        # CCT devices: Sweep from warm to cool
+        for kelvin in _TEST_PATTERN_KELVIN:
+            await device.set_color_temp(kelvin, brightness=255)
+            await asyncio.sleep(0.7)
+    else:
+        # Dimmer-only: Just flash on/off
+        for _ in range(3):
+            await asyncio.sleep(0.4)
+            await device.turn_off()
+            await asyncio.sleep(0.3)
+            await device.turn_on()
+
+    await device.turn_off()
+
+
 def _is_valid_device_name(name: str) -> bool:
     """Check if device name matches supported patterns.
 
     Source: protocol_docs/02_ble_scanning_device_discovery.md
     Accepts: LEDnetWF*, IOTWF*, IOTB*
     """
-    if not name:
+    # Empty/short names can't match even the shortest prefix ("iotb"); only the
+    # prefix matters otherwise, so lowercase at most its 8 characters
+    if not name or len(name) < 4:
         return False
-    name_lower = name.lower()
-    return (
-        name_lower.startswith("lednetwf") or
-        name_lower.startswith("iotwf") or
-        name_lower.startswith("iotb")
-    )
+    return name[:8].lower().startswith(_VALID_NAME_PREFIXES)
 
 
-def _parse_discovery(discovery: BluetoothServiceInfoBleak) -> dict | None:
+def _parse_discovery(discovery: BluetoothServiceInfoBleak) -> _DiscoveryInfo | None:
     """Parse discovery info and extract product ID."""
     name = discovery.name or ""
 
@@ -80,11 +249,10 @@ def _parse_discovery(discovery: BluetoothServiceInfoBleak) -> dict | None:
     if not _is_valid_device_name(name):
         return None
 
-    # Parse manufacturer data
-    manu_data = protocol.parse_manufacturer_data(discovery.manufacturer_data, name)
-    if manu_data:
-        product_id = manu_data.get("product_id")
-        fw_version = manu_data.get("fw_version")
+    # Only product_id and fw_version are needed here, so skip the state parse
+    brief = protocol.parse_manufacturer_data_brief(discovery.manufacturer_data, name)
+    if brief:
+        product_id, fw_version = brief
     else:
         # No manufacturer data in this advertisement. This happens under passive
         # scanning (the manu data sits in a scan response we never see) and for
@@ -96,31 +264,31 @@ def _parse_discovery(discovery: BluetoothServiceInfoBleak) -> dict | None:
         # Only trust a *name-derived* LEDnetWF product_id if it maps to a known
         # device; otherwise leave it as None so the flow probes capabilities
         # rather than risk acting on a misparsed id. IOTBT (0x00) is always valid.
-        if product_id not in (None, 0x00):
-            caps = get_device_capabilities(product_id)
-            if not caps or str(caps.get("name", "")).startswith("Unknown"):
-                _LOGGER.debug(
-                    "Device %s: name-derived product 0x%02X is unknown, will probe",
-                    name, product_id,
-                )
-                product_id = None
+        if product_id not in (None, 0x00) and resolve_device(product_id).needs_probing:
+            _LOGGER.debug(
+                "Device %s: name-derived product 0x%02X is unknown, will probe",
+                name, product_id,
+            )
+            product_id = None
 
-        _LOGGER.debug(
-            "Device %s has no manufacturer data; identified by name as product %s",
-            name, f"0x{product_id:02X}" if product_id is not None else "unknown (probe)",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Device %s has no manufacturer data; identified by name as product %s",
+                name,
+                f"0x{product_id:02X}" if product_id is not None else "unknown (probe)",
+            )
 
-    if not is_supported_device(product_id):
+    if not resolve_device(product_id).supported:
         _LOGGER.debug("Device %s (product 0x%02X) not supported", name, product_id or 0)
         return None
 
-    return {
-        "address": discovery.address,
-        "name": name,
-        "product_id": product_id,
-        "fw_version": fw_version,
-        "rssi": discovery.rssi,
-    }
+    return _DiscoveryInfo(
+        address=discovery.address,
+        name=name,
+        product_id=product_id,
+        fw_version=fw_version,
+        rssi=discovery.rssi,
+    )
 
 
 class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -130,8 +298,17 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._discovery_info: dict | None = None
-        self._discovered_devices: dict[str, dict] = {}
+        self._discovery_info: _DiscoveryInfo | None = None
+        self._discovered_devices: dict[str, _DiscoveryInfo] = {}
+        self._last_scan: float = 0.0
+        self._caps: Mapping[str, Any] | None = None
+
+    @property
+    def _device_caps(self) -> Mapping[str, Any]:
+        """Capabilities for the discovered product, looked up once per device."""
+        if self._caps is None:
+            self._caps = resolve_device(self._discovery_info.product_id).caps
+        return self._caps
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -139,16 +316,21 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle Bluetooth discovery."""
         _LOGGER.debug("Bluetooth discovery: %s", discovery_info.address)
 
+        # Already-configured (or ignored) devices need no parsing at all
+        unique_id = _format_mac(discovery_info.address)
+        if unique_id in self._async_current_ids():
+            return self.async_abort(reason="already_configured")
+
         parsed = _parse_discovery(discovery_info)
         if not parsed:
             return self.async_abort(reason="not_supported")
 
-        address = parsed["address"]
-        await self.async_set_unique_id(format_mac(address))
+        await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
 
         self._discovery_info = parsed
-        self.context["title_placeholders"] = {"name": parsed["name"]}
+        self._caps = None
+        self.context["title_placeholders"] = {"name": parsed.name}
 
         return await self.async_step_confirm()
 
@@ -162,30 +344,36 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             address = user_input[CONF_MAC]
             if address in self._discovered_devices:
                 self._discovery_info = self._discovered_devices[address]
-                await self.async_set_unique_id(format_mac(address))
+                self._caps = None
+                await self.async_set_unique_id(_format_mac(address))
                 self._abort_if_unique_id_configured()
                 return await self.async_step_confirm()
 
-        # Scan for devices
-        self._discovered_devices = {}
-        configured_addresses = {
-            entry.unique_id for entry in self._async_current_entries()
-        }
-
-        for discovery in async_discovered_service_info(self.hass):
-            parsed = _parse_discovery(discovery)
-            if parsed and format_mac(parsed["address"]) not in configured_addresses:
-                self._discovered_devices[parsed["address"]] = parsed
-
-        if not self._discovered_devices:
-            return self.async_abort(reason="no_devices_found")
+        # Scan for devices, reusing a very recent scan when the form is re-rendered
+        now = time.monotonic()
+        if not self._discovered_devices or now - self._last_scan > _USER_SCAN_MAX_AGE:
+            self._discovered_devices = {}
+            configured_addresses = {
+                entry.unique_id for entry in self._async_current_entries()
+            }
+            for discovery in async_discovered_service_info(self.hass):
+                # Skip configured devices before parsing any advertisement data
+                addr = discovery.address
+                if _format_mac(addr) in configured_addresses:
+                    continue
+                parsed = _parse_discovery(discovery)
+                if parsed:
+                    self._discovered_devices[addr] = parsed
+            self._last_scan = now
 
-        # Build device selection
         device_options = {
-            addr: f"{info['name']} ({addr})"
-            for addr, info in self._discovered_devices.items()
+            addr: f"{parsed.name} ({addr})"
+            for addr, parsed in self._discovered_devices.items()
         }
 
+        if not device_options:
+            return self.async_abort(reason="no_devices_found")
+
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
@@ -205,27 +393,7 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # First visit - just show the form, don't connect yet
         if user_input is None:
-            # Build description placeholders with device info
-            product_id = self._discovery_info.get("product_id")
-            placeholders = {
-                "name": self._discovery_info["name"],
-                "address": self._discovery_info["address"],
-                "product_id": f"0x{product_id:02X}" if product_id is not None else "Unknown",
-            }
-            # Add firmware version if available
-            fw_version = self._discovery_info.get("fw_version")
-            if fw_version:
-                placeholders["fw_version"] = str(fw_version)
-            else:
-                placeholders["fw_version"] = "Unknown"
-
-            return self.async_show_form(
-                step_id="confirm",
-                data_schema=vol.Schema({
-                    vol.Required("test_device", default=True): bool,
-                }),
-                description_placeholders=placeholders,
-            )
+            return self._async_show_confirm_form(errors)
 
         # User wants to skip testing and just add
         if not user_input.get("test_device"):
@@ -234,59 +402,38 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # User wants to test - flash the device and probe if needed
         # Use setup_mode=True for single connection attempt (no retries)
         # and wrap in overall timeout so UI doesn't hang
+        # Imported here so loading the flow module doesn't pull in bleak
+        from .device import LEDNetWFDevice
+
         device = None
         try:
-            product_id = self._discovery_info.get("product_id")
+            product_id = self._discovery_info.product_id
             device = LEDNetWFDevice(
                 self.hass,
-                self._discovery_info["address"],
-                self._discovery_info["name"],
+                self._discovery_info.address,
+                self._discovery_info.name,
                 product_id,
                 setup_mode=True,  # Single connection attempt, fast failure
             )
 
-            # Overall timeout for the entire test operation (15 seconds)
+            # Overall timeout for the entire test operation (15 seconds). Overlapping
+            # the LED settings query with the test pattern does not shorten the worst
+            # case: probing an unknown product runs up to four 3 s state queries.
             async def _test_device():
                 # If device needs capability probing (unknown product ID), probe first
-                if needs_capability_probing(product_id):
+                if self._device_caps["needs_probing"]:
                     _LOGGER.info(
                         "Unknown product ID 0x%02X - probing capabilities",
                         product_id or 0
                     )
                     probed_caps = await device.probe_capabilities()
                     # Store probed capabilities for later use
-                    self._discovery_info["probed_capabilities"] = probed_caps
+                    self._discovery_info.probed_capabilities = probed_caps
                     _LOGGER.info("Probed capabilities: %s", probed_caps)
 
-                # Test pattern based on device capabilities
-                await device.turn_on()
-                await asyncio.sleep(0.3)
-
-                if device.has_rgb:
-                    # RGB devices: Show R-G-B test pattern at full brightness
-                    # Easily distinguishable from effects and confirms color control
-                    for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
-                        await device.set_rgb_color(color, brightness=255)
-                        await asyncio.sleep(0.7)
-                elif device.has_color_temp:
-                    # CCT devices: Sweep from warm to cool
-                    for kelvin in [2700, 4600, 6500]:
-                        await device.set_color_temp(kelvin, brightness=255)
-                        await asyncio.sleep(0.7)
-                else:
-                    # Dimmer-only: Just flash on/off
-                    for _ in range(3):
-                        await asyncio.sleep(0.4)
-                        await device.turn_off()
-                        await asyncio.sleep(0.3)
-                        await device.turn_on()
-
-                await device.turn_off()
-
-                # Query LED settings if device supports it
                 caps = device.capabilities  # Use device's capabilities (may be probed)
                 _LOGGER.debug(
-                    "Device capabilities after flash test: has_ic_config=%s, has_color_order=%s, effect_type=%s",
+                    "Device capabilities for test: has_ic_config=%s, has_color_order=%s, effect_type=%s",
                     caps.get("has_ic_config"), caps.get("has_color_order"), caps.get("effect_type")
                 )
                 if (caps.get("has_ic_config")
@@ -294,7 +441,13 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Ring / FillLight devices answer the same 0x63 query (parsed in
                     # the ring-specific branch); if they don't, this times out and we
                     # fall back to defaults, so it is safe to attempt.
-                    led_settings = await device.query_led_settings_and_wait(timeout=3.0)
+                    # The 0x63 reply is matched on its own event, so the query can
+                    # overlap the test pattern instead of waiting for it to finish;
+                    # the device serialises the writes of both (_write_lock).
+                    _, led_settings = await asyncio.gather(
+                        _async_show_test_pattern(device),
+                        device.query_led_settings_and_wait(timeout=3.0),
+                    )
                     if led_settings:
                         _LOGGER.info(
                             "Queried LED settings: count=%s, type=%s, order=%s",
@@ -303,7 +456,9 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             led_settings.get("color_order"),
                         )
                         # Store for use in options step
-                        self._discovery_info["queried_led_settings"] = led_settings
+                        self._discovery_info.queried_led_settings = led_settings
+                else:
+                    await _async_show_test_pattern(device)
 
                 # For SIMPLE devices with color order support, explicitly query state
                 # to get current color order (can't rely on turn_on/off notifications)
@@ -312,59 +467,47 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     await device.query_state_and_wait(timeout=3.0)
                     if device.color_order:
                         _LOGGER.info("Queried color order: %d", device.color_order)
-                        self._discovery_info["queried_color_order"] = device.color_order
+                        self._discovery_info.queried_color_order = device.color_order
 
             try:
-                await asyncio.wait_for(_test_device(), timeout=15.0)
+                async with asyncio.timeout(15.0):
+                    await _test_device()
             except asyncio.TimeoutError:
                 _LOGGER.warning("Device test timed out after 15 seconds")
                 raise BleakNotFoundError("Connection timed out")
 
-            await device.stop()
-
         except BleakNotFoundError:
-            # Clean up the device on failure
-            if device:
-                await device.stop()
             errors["base"] = "cannot_connect"
-            # Re-use the same placeholders
-            product_id = self._discovery_info.get("product_id")
-            placeholders = {
-                "name": self._discovery_info["name"],
-                "address": self._discovery_info["address"],
-                "product_id": f"0x{product_id:02X}" if product_id is not None else "Unknown",
-                "fw_version": str(self._discovery_info.get("fw_version") or "Unknown"),
-            }
-            return self.async_show_form(
-                step_id="confirm",
-                data_schema=vol.Schema({vol.Required("test_device", default=True): bool}),
-                errors=errors,
-                description_placeholders=placeholders,
-            )
         except Exception as ex:
-            # Clean up the device on failure
-            if device:
-                await device.stop()
             _LOGGER.exception("Validation error: %s", ex)
             errors["base"] = "unknown"
-            # Re-use the same placeholders
-            product_id = self._discovery_info.get("product_id")
-            placeholders = {
-                "name": self._discovery_info["name"],
-                "address": self._discovery_info["address"],
-                "product_id": f"0x{product_id:02X}" if product_id is not None else "Unknown",
-                "fw_version": str(self._discovery_info.get("fw_version") or "Unknown"),
-            }
-            return self.async_show_form(
-                step_id="confirm",
-                data_schema=vol.Schema({vol.Required("test_device", default=True): bool}),
-                errors=errors,
-                description_placeholders=placeholders,
-            )
+        finally:
+            # Disconnect whether the test passed or failed
+            if device:
+                await device.stop()
+
+        if errors:
+            return self._async_show_confirm_form(errors)
 
         # Device flashed successfully - create entry with defaults
         return self._create_entry({})
 
+    def _async_show_confirm_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the confirm form with device info placeholders."""
+        product_id = self._discovery_info.product_id
+        placeholders = {
+            "name": self._discovery_info.name,
+            "address": self._discovery_info.address,
+            "product_id": f"0x{product_id:02X}" if product_id is not None else "Unknown",
+            "fw_version": str(self._discovery_info.fw_version or "Unknown"),
+        }
+        return self.async_show_form(
+            step_id="confirm",
+            data_schema=_CONFIRM_SCHEMA,
+            errors=errors or None,
+            description_placeholders=placeholders,
+        )
+
     async def async_step_options(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -372,17 +515,17 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             return self._create_entry(user_input)
 
-        caps = get_device_capabilities(self._discovery_info.get("product_id"))
+        caps = self._device_caps
 
         # Get queried LED settings if available (from device test step)
-        queried = self._discovery_info.get("queried_led_settings", {})
+        queried = self._discovery_info.queried_led_settings or {}
 
         # Build options schema based on device capabilities
         schema_dict: dict[vol.Marker, Any] = {
             vol.Optional(
                 CONF_DISCONNECT_DELAY,
                 default=DEFAULT_DISCONNECT_DELAY,
-            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+            ): _DISCONNECT_DELAY_VALIDATOR,
         }
 
         # Only show LED config for addressable strips
@@ -390,91 +533,28 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Use queried values as defaults if available, otherwise use hardcoded defaults
             default_led_count = queried.get("led_count") or DEFAULT_LED_COUNT
             default_segments = queried.get("segments") or DEFAULT_SEGMENTS
-
-            # Map IC type value to enum name
-            queried_ic_type = queried.get("ic_type")
-            default_led_type = LedType.WS2812B.name
-            if queried_ic_type is not None:
-                for lt in LedType:
-                    if lt.value == queried_ic_type:
-                        default_led_type = lt.name
-                        break
-
-            # Map color order value to enum name
-            queried_color_order = queried.get("color_order")
-            default_color_order = ColorOrder.GRB.name
-            if queried_color_order is not None:
-                for co in ColorOrder:
-                    if co.value == queried_color_order:
-                        default_color_order = co.name
-                        break
-
-            schema_dict.update({
-                vol.Optional(CONF_LED_COUNT, default=default_led_count): NumberSelector(
-                    NumberSelectorConfig(min=1, max=1000, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_SEGMENTS, default=default_segments): NumberSelector(
-                    NumberSelectorConfig(min=1, max=100, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_LED_TYPE, default=default_led_type): vol.In(
-                    [t.name for t in LedType]
-                ),
-                vol.Optional(CONF_COLOR_ORDER, default=default_color_order): vol.In(
-                    [o.name for o in ColorOrder]
-                ),
-            })
-
-        # Ring / FillLight (ADDRESSABLE_0x53): LED count + chip type + colour order,
-        # single segment, ring-specific chip-type numbering.
+            schema_dict.update(_addressable_led_schema(
+                default_led_count,
+                default_segments,
+                queried.get("ic_type"),
+                queried.get("color_order"),
+            ))
+
+        # Ring / FillLight (ADDRESSABLE_0x53): LED count + chip type + colour order
         elif caps.get("effect_type") == EffectType.ADDRESSABLE_0x53:
             default_led_count = queried.get("led_count") or DEFAULT_LED_COUNT
+            schema_dict.update(_ring_led_schema(
+                default_led_count, queried.get("ic_type"), queried.get("color_order")
+            ))
 
-            queried_ic_type = queried.get("ic_type")
-            default_led_type = RingLedType.WS2812B.name
-            if queried_ic_type is not None:
-                for lt in RingLedType:
-                    if lt.value == queried_ic_type:
-                        default_led_type = lt.name
-                        break
-
-            queried_color_order = queried.get("color_order")
-            default_color_order = ColorOrder.GRB.name
-            if queried_color_order is not None:
-                for co in ColorOrder:
-                    if co.value == queried_color_order:
-                        default_color_order = co.name
-                        break
-
-            schema_dict.update({
-                vol.Optional(CONF_LED_COUNT, default=default_led_count): NumberSelector(
-                    NumberSelectorConfig(min=1, max=255, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_LED_TYPE, default=default_led_type): vol.In(
-                    [t.name for t in RingLedType]
-                ),
-                vol.Optional(CONF_COLOR_ORDER, default=default_color_order): vol.In(
-                    [o.name for o in ColorOrder]
-                ),
-            })
-
-        # Color order for SIMPLE devices (0x33, etc.) - only RGB, GRB, BRG
+        # Color order for SIMPLE devices (0x33, etc.)
         elif caps.get("has_color_order"):
-            queried_color_order = self._discovery_info.get("queried_color_order")
-            default_color_order = SimpleColorOrder.GRB.name
-            if queried_color_order is not None:
-                for co in SimpleColorOrder:
-                    if co.value == queried_color_order:
-                        default_color_order = co.name
-                        break
-
-            schema_dict.update({
-                vol.Optional(CONF_COLOR_ORDER, default=default_color_order): vol.In(
-                    [o.name for o in SimpleColorOrder]
-                ),
-            })
+            schema_dict.update(_simple_color_order_schema(
+                self._discovery_info.queried_color_order
+            ))
 
         # Calculate total LEDs for display in description
-        placeholders = {"name": self._discovery_info["name"]}
+        placeholders = {"name": self._discovery_info.name}
         if caps.get("has_ic_config"):
             total_leds = default_led_count * default_segments
             placeholders["total_leds"] = str(total_leds)
@@ -490,19 +570,19 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def _create_entry(self, options: dict[str, Any]) -> FlowResult:
         """Create the config entry."""
         data = {
-            CONF_MAC: self._discovery_info["address"],
-            CONF_NAME: self._discovery_info["name"],
-            CONF_PRODUCT_ID: self._discovery_info.get("product_id"),
+            CONF_MAC: self._discovery_info.address,
+            CONF_NAME: self._discovery_info.name,
+            CONF_PRODUCT_ID: self._discovery_info.product_id,
         }
 
         # Store probed capabilities if available
-        if "probed_capabilities" in self._discovery_info:
-            data["probed_capabilities"] = self._discovery_info["probed_capabilities"]
+        if self._discovery_info.probed_capabilities is not None:
+            data["probed_capabilities"] = self._discovery_info.probed_capabilities
 
         # Get queried LED settings (from device test step) to use as defaults
-        queried = self._discovery_info.get("queried_led_settings", {})
-        queried_color_order = self._discovery_info.get("queried_color_order")
-        caps = get_device_capabilities(self._discovery_info.get("product_id"))
+        queried = self._discovery_info.queried_led_settings or {}
+        queried_color_order = self._discovery_info.queried_color_order
+        caps = self._device_caps
 
         # Process options
         processed_options = {
@@ -512,44 +592,24 @@ class LEDNetWFConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         }
 
         # Use user-provided options first, then queried values, then defaults
-        if CONF_LED_COUNT in options:
-            processed_options[CONF_LED_COUNT] = int(options[CONF_LED_COUNT])
-        elif queried.get("led_count"):
+        processed_options.update(_convert_led_options(
+            options, caps, caps.get("effect_type") == EffectType.ADDRESSABLE_0x53
+        ))
+        if CONF_LED_COUNT not in processed_options and queried.get("led_count"):
             processed_options[CONF_LED_COUNT] = queried["led_count"]
-
-        if CONF_SEGMENTS in options:
-            processed_options[CONF_SEGMENTS] = int(options[CONF_SEGMENTS])
-        elif queried.get("segments"):
+        if CONF_SEGMENTS not in processed_options and queried.get("segments"):
             processed_options[CONF_SEGMENTS] = queried["segments"]
-
-        if CONF_LED_TYPE in options:
-            # Ring / FillLight devices use the ring-specific chip-type numbering.
-            led_type_enum = (
-                RingLedType
-                if caps.get("effect_type") == EffectType.ADDRESSABLE_0x53
-                else LedType
-            )
-            processed_options[CONF_LED_TYPE] = led_type_enum[options[CONF_LED_TYPE]].value
-        elif queried.get("ic_type") is not None:
+        if CONF_LED_TYPE not in processed_options and queried.get("ic_type") is not None:
             processed_options[CONF_LED_TYPE] = queried["ic_type"]
-
-        if CONF_COLOR_ORDER in options:
-            color_order_name = options[CONF_COLOR_ORDER]
-            # Check if it's a SimpleColorOrder (for SIMPLE devices) or ColorOrder (for addressable)
-            if caps.get("has_color_order") and not caps.get("has_ic_config"):
-                # SIMPLE device - use SimpleColorOrder
-                processed_options[CONF_COLOR_ORDER] = SimpleColorOrder[color_order_name].value
-            else:
-                # Addressable/Symphony device - use ColorOrder
-                processed_options[CONF_COLOR_ORDER] = ColorOrder[color_order_name].value
-        elif queried.get("color_order") is not None:
-            processed_options[CONF_COLOR_ORDER] = queried["color_order"]
-        elif queried_color_order is not None:
-            # For SIMPLE devices, color_order comes from state query
-            processed_options[CONF_COLOR_ORDER] = queried_color_order
+        if CONF_COLOR_ORDER not in processed_options:
+            if queried.get("color_order") is not None:
+                processed_options[CONF_COLOR_ORDER] = queried["color_order"]
+            elif queried_color_order is not None:
+                # For SIMPLE devices, color_order comes from state query
+                processed_options[CONF_COLOR_ORDER] = queried_color_order
 
         return self.async_create_entry(
-            title=self._discovery_info["name"],
+            title=self._discovery_info.name,
             data=data,
             options=processed_options,
         )
@@ -569,6 +629,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        self._caps = resolve_device(config_entry.data.get(CONF_PRODUCT_ID)).caps
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -577,8 +638,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self._save_options(user_input)
 
-        product_id = self._config_entry.data.get(CONF_PRODUCT_ID)
-        caps = get_device_capabilities(product_id)
+        caps = self._caps
         options = self._config_entry.options
 
         # IOTBT segment devices are detected at runtime (not via product caps),
@@ -597,7 +657,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_DISCONNECT_DELAY,
                 default=options.get(CONF_DISCONNECT_DELAY, DEFAULT_DISCONNECT_DELAY),
-            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+            ): _DISCONNECT_DELAY_VALIDATOR,
         }
 
         if is_iotbt_segment:
@@ -618,88 +678,33 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             )
 
             schema_dict.update({
-                vol.Optional(CONF_LED_COUNT, default=current_led_count): NumberSelector(
-                    NumberSelectorConfig(min=1, max=255, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_SEGMENTS, default=current_segments): NumberSelector(
-                    NumberSelectorConfig(min=1, max=255, mode=NumberSelectorMode.BOX)
-                ),
+                vol.Optional(CONF_LED_COUNT, default=current_led_count): _BYTE_COUNT_SELECTOR,
+                vol.Optional(CONF_SEGMENTS, default=current_segments): _BYTE_COUNT_SELECTOR,
             })
         elif caps.get("has_ic_config"):
             current_led_count = options.get(CONF_LED_COUNT, DEFAULT_LED_COUNT)
             current_segments = options.get(CONF_SEGMENTS, DEFAULT_SEGMENTS)
-            current_led_type = options.get(CONF_LED_TYPE, LedType.WS2812B.value)
-            current_color_order = options.get(CONF_COLOR_ORDER, ColorOrder.GRB.value)
-
-            # Convert values back to names for display
-            led_type_name = next(
-                (t.name for t in LedType if t.value == current_led_type),
-                LedType.WS2812B.name,
-            )
-            color_order_name = next(
-                (o.name for o in ColorOrder if o.value == current_color_order),
-                ColorOrder.GRB.name,
-            )
-
-            schema_dict.update({
-                vol.Optional(CONF_LED_COUNT, default=current_led_count): NumberSelector(
-                    NumberSelectorConfig(min=1, max=1000, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_SEGMENTS, default=current_segments): NumberSelector(
-                    NumberSelectorConfig(min=1, max=100, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_LED_TYPE, default=led_type_name): vol.In(
-                    [t.name for t in LedType]
-                ),
-                vol.Optional(CONF_COLOR_ORDER, default=color_order_name): vol.In(
-                    [o.name for o in ColorOrder]
-                ),
-            })
-
-        # Ring / FillLight (ADDRESSABLE_0x53): LED count + chip type + colour order.
-        # These devices support a single segment only, so no segments field, and the
-        # chip type uses the ring-specific RingLedType numbering.
+            schema_dict.update(_addressable_led_schema(
+                current_led_count,
+                current_segments,
+                options.get(CONF_LED_TYPE, LedType.WS2812B.value),
+                options.get(CONF_COLOR_ORDER, ColorOrder.GRB.value),
+            ))
+
+        # Ring / FillLight (ADDRESSABLE_0x53): LED count + chip type + colour order
         elif is_ring:
             current_led_count = options.get(CONF_LED_COUNT, DEFAULT_LED_COUNT)
-            current_led_type = options.get(CONF_LED_TYPE, RingLedType.WS2812B.value)
-            current_color_order = options.get(CONF_COLOR_ORDER, ColorOrder.GRB.value)
-
-            led_type_name = next(
-                (t.name for t in RingLedType if t.value == current_led_type),
-                RingLedType.WS2812B.name,
-            )
-            color_order_name = next(
-                (o.name for o in ColorOrder if o.value == current_color_order),
-                ColorOrder.GRB.name,
-            )
-
-            schema_dict.update({
-                vol.Optional(CONF_LED_COUNT, default=current_led_count): NumberSelector(
-                    NumberSelectorConfig(min=1, max=255, mode=NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_LED_TYPE, default=led_type_name): vol.In(
-                    [t.name for t in RingLedType]
-                ),
-                vol.Optional(CONF_COLOR_ORDER, default=color_order_name): vol.In(
-                    [o.name for o in ColorOrder]
-                ),
-            })
+            schema_dict.update(_ring_led_schema(
+                current_led_count,
+                options.get(CONF_LED_TYPE, RingLedType.WS2812B.value),
+                options.get(CONF_COLOR_ORDER, ColorOrder.GRB.value),
+            ))
 
         # Color order for SIMPLE devices (0x33, etc.)
         elif caps.get("has_color_order"):
-            current_color_order = options.get(CONF_COLOR_ORDER, SimpleColorOrder.GRB.value)
-
-            # Convert value back to name for display
-            color_order_name = next(
-                (o.name for o in SimpleColorOrder if o.value == current_color_order),
-                SimpleColorOrder.GRB.name,
-            )
-
-            schema_dict.update({
-                vol.Optional(CONF_COLOR_ORDER, default=color_order_name): vol.In(
-                    [o.name for o in SimpleColorOrder]
-                ),
-            })
+            schema_dict.update(_simple_color_order_schema(
+                options.get(CONF_COLOR_ORDER, SimpleColorOrder.GRB.value)
+            ))
 
         # IOTBT devices: protocol override (Auto/Telink/Segment). The 0x5A00 family
         # cannot be auto-detected reliably across firmware, so let the user force it.
@@ -707,12 +712,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             current_protocol = options.get(CONF_IOTBT_PROTOCOL, IOTBT_PROTOCOL_AUTO)
             schema_dict[
                 vol.Optional(CONF_IOTBT_PROTOCOL, default=current_protocol)
-            ] = SelectSelector(
-                SelectSelectorConfig(
-                    options=list(IOTBT_PROTOCOL_CHOICES),
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            )
+            ] = _IOTBT_PROTOCOL_SELECTOR
 
         # Calculate total LEDs for display in description
         placeholders = {}
@@ -730,8 +730,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     def _save_options(self, user_input: dict[str, Any]) -> FlowResult:
         """Save options."""
-        product_id = self._config_entry.data.get(CONF_PRODUCT_ID)
-        caps = get_device_capabilities(product_id)
+        caps = self._caps
         device = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id)
         is_ring = (
             (device is not None and device.effect_type == EffectType.ADDRESSABLE_0x53)
@@ -744,23 +743,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             ),
         }
 
-        if CONF_LED_COUNT in user_input:
-            new_options[CONF_LED_COUNT] = int(user_input[CONF_LED_COUNT])
-        if CONF_SEGMENTS in user_input:
-            new_options[CONF_SEGMENTS] = int(user_input[CONF_SEGMENTS])
-        if CONF_LED_TYPE in user_input:
-            # Ring / FillLight devices use the ring-specific chip-type numbering.
-            led_type_enum = RingLedType if is_ring else LedType
-            new_options[CONF_LED_TYPE] = led_type_enum[user_input[CONF_LED_TYPE]].value
-        if CONF_COLOR_ORDER in user_input:
-            color_order_name = user_input[CONF_COLOR_ORDER]
-            # Check if it's a SimpleColorOrder (for SIMPLE devices) or ColorOrder (for addressable)
-            if caps.get("has_color_order") and not caps.get("has_ic_config"):
-                # SIMPLE device - use SimpleColorOrder
-                new_options[CONF_COLOR_ORDER] = SimpleColorOrder[color_order_name].value
-            else:
-                # Addressable/Symphony device - use ColorOrder
-                new_options[CONF_COLOR_ORDER] = ColorOrder[color_order_name].value
+        new_options.update(_convert_led_options(user_input, caps, is_ring))
 
         if CONF_IOTBT_PROTOCOL in user_input:
             new_options[CONF_IOTBT_PROTOCOL] = user_input[CONF_IOTBT_PROTOCOL]
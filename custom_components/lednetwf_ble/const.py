@@ -1,7 +1,9 @@
 """Constants for LEDnetWF BLE v2 integration."""
 import logging
 from enum import IntEnum
-from typing import Final
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, Mapping, NamedTuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -126,7 +128,8 @@ class EffectType(IntEnum):
 class ValueScale(IntEnum):
     """Value scale for brightness/speed in advertisement data.
 
-    Determines how to convert raw advertisement values to internal 0-255/0-100 format.
+    Reported by get_brightness_scale / get_speed_scale. The convert_*_from_adv
+    functions apply the same rules directly rather than comparing scales.
     """
     PERCENT = 0         # 0-100 percentage scale (default for most devices)
     RAW_255 = 1         # 0-255 raw scale (some newer devices)
@@ -490,9 +493,9 @@ IOTBT_SEGMENT_EFFECTS: Final = {
 # Source: model_0x54.py, protocol_docs/07a_effect_commands_by_device.md
 # These devices use inverted speed where 0x01=fastest, 0x1F=slowest
 # Note: Symphony devices (0xA1-0xA9) do NOT use inverted speed - they use 1=slow, 31=fast
-INVERTED_SPEED_PRODUCT_IDS: Final = {
+INVERTED_SPEED_PRODUCT_IDS: Final = frozenset({
     0x54, 0x55, 0x62, 0x5B,  # Strip controllers
-}
+})
 
 # Product ID to capabilities mapping
 # Source: protocol_docs/04_device_identification_capabilities.md
@@ -590,100 +593,205 @@ PRODUCT_CAPABILITIES: Final = {
 }
 
 
-def get_device_capabilities(product_id: int | None) -> dict:
-    """Get device capabilities from product ID.
-
-    For known devices, returns documented capabilities.
-    For unknown devices, returns a stub indicating probing is needed.
+def _freeze_capabilities(table: dict[int, Any]) -> dict[int, Mapping[str, Any]]:
+    """Build read-only copies of capability entries, precomputing needs_probing.
 
-    Source: protocol_docs/04_device_identification_capabilities.md
+    get_device_capabilities returns these shared mappings instead of copying an
+    entry per lookup. Identical entries (e.g. the Symphony controllers) share
+    one mapping. The source table is left untouched.
     """
-    if product_id is None:
-        caps = {
-            "name": "Unknown",
-            "has_rgb": None,
-            "has_ww": None,
-            "has_cw": None,
-            "effect_type": EffectType.NONE,
-            "needs_probing": True,
-        }
-        _LOGGER.debug(
-            "Device capabilities for product_id=None: %s (probing required)",
-            caps
+    shared: dict[tuple, Mapping[str, Any]] = {}
+    frozen_table: dict[int, Mapping[str, Any]] = {}
+    for pid, caps in table.items():
+        frozen = {**caps, "needs_probing": caps.get("is_stub", False)}
+        frozen_table[pid] = shared.setdefault(
+            tuple(frozen.items()), MappingProxyType(frozen)
         )
-        return caps
+    return frozen_table
 
-    if product_id in PRODUCT_CAPABILITIES:
-        caps = PRODUCT_CAPABILITIES[product_id].copy()
-        caps["needs_probing"] = caps.get("is_stub", False)
-        _LOGGER.debug(
-            "Device capabilities for product_id=0x%02X (%d): name=%s, "
-            "has_rgb=%s, has_ww=%s, has_cw=%s, effect_type=%s, needs_probing=%s",
-            product_id, product_id,
-            caps.get("name"),
-            caps.get("has_rgb"),
-            caps.get("has_ww"),
-            caps.get("has_cw"),
-            caps.get("effect_type"),
-            caps.get("needs_probing"),
-        )
-        return caps
 
-    # Unknown product ID - needs capability probing
+# Frozen view of PRODUCT_CAPABILITIES returned by get_device_capabilities
+_FROZEN_CAPABILITIES: Final = _freeze_capabilities(PRODUCT_CAPABILITIES)
+
+# Product IDs answering the is_supported_device / needs_capability_probing checks
+_SWITCH_PRODUCT_IDS: Final = frozenset(
+    pid for pid, caps in PRODUCT_CAPABILITIES.items() if caps.get("is_switch")
+)
+_STUB_PRODUCT_IDS: Final = frozenset(
+    pid for pid, caps in PRODUCT_CAPABILITIES.items() if caps.get("is_stub")
+)
+
+# Returned for a missing product_id
+_UNKNOWN_CAPABILITIES: Final = MappingProxyType({
+    "name": "Unknown",
+    "has_rgb": None,
+    "has_ww": None,
+    "has_cw": None,
+    "effect_type": EffectType.NONE,
+    "needs_probing": True,
+})
+
+
+@lru_cache(maxsize=64)
+def _unknown_capabilities(product_id: int) -> Mapping[str, Any]:
+    """Stub capabilities for a product ID missing from PRODUCT_CAPABILITIES."""
     # Per protocol docs: "For devices with unknown Product ID (0x00) or stub classes, probe capabilities"
-    caps = {
+    return MappingProxyType({
         "name": f"Unknown_0x{product_id:02X}",
         "has_rgb": None,
         "has_ww": None,
         "has_cw": None,
         "effect_type": EffectType.SYMPHONY,  # Assume modern device with Symphony support
         "needs_probing": True,
-    }
-    _LOGGER.debug(
-        "Device capabilities for UNKNOWN product_id=0x%02X (%d): %s (probing required)",
-        product_id, product_id, caps
-    )
+    })
+
+
+def _lookup_capabilities(product_id: int | None) -> Mapping[str, Any]:
+    """Capabilities for a product ID, without logging."""
+    if product_id is None:
+        return _UNKNOWN_CAPABILITIES
+    caps = _FROZEN_CAPABILITIES.get(product_id)
+    return caps if caps is not None else _unknown_capabilities(product_id)
+
+
+def get_device_capabilities(product_id: int | None) -> Mapping[str, Any]:
+    """Get device capabilities from product ID.
+
+    For known devices, returns documented capabilities.
+    For unknown devices, returns a stub indicating probing is needed.
+    The returned mapping is read-only; callers that update it must copy it first.
+
+    Source: protocol_docs/04_device_identification_capabilities.md
+    """
+    caps = _lookup_capabilities(product_id)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        if product_id is None:
+            _LOGGER.debug(
+                "Device capabilities for product_id=None: %s (probing required)",
+                caps
+            )
+        elif product_id in PRODUCT_CAPABILITIES:
+            _LOGGER.debug(
+                "Device capabilities for product_id=%s: name=%s, "
+                "has_rgb=%s, has_ww=%s, has_cw=%s, effect_type=%s, needs_probing=%s",
+                f"0x{product_id:02X} ({product_id})",
+                caps.get("name"),
+                caps.get("has_rgb"),
+                caps.get("has_ww"),
+                caps.get("has_cw"),
+                caps.get("effect_type"),
+                caps.get("needs_probing"),
+            )
+        else:
+            _LOGGER.debug(
+                "Device capabilities for UNKNOWN product_id=%s: %s (probing required)",
+                f"0x{product_id:02X} ({product_id})", caps
+            )
     return caps
 
 
-def is_supported_device(product_id: int | None) -> bool:
-    """Check if a device might be supported (not a known switch/socket).
+class DeviceInfo(NamedTuple):
+    """Capabilities of a product ID plus the flags derived from them."""
+
+    caps: Mapping[str, Any]
+    supported: bool
+    needs_probing: bool
+
+
+def _device_info(caps: Mapping[str, Any]) -> DeviceInfo:
+    """Derive the DeviceInfo flags from a capabilities mapping."""
+    return DeviceInfo(caps, not caps.get("is_switch"), caps["needs_probing"])
 
-    Unknown devices return True since they should be probed for capabilities.
-    Only explicitly-known switches/sockets return False.
+
+# Prebuilt for every known product ID, so resolve_device is a single lookup
+_DEVICE_INFO: Final = {
+    pid: _device_info(caps) for pid, caps in _FROZEN_CAPABILITIES.items()
+}
+
+
+def resolve_device(product_id: int | None) -> DeviceInfo:
+    """Look up a product ID once and derive its support and probing flags.
+
+    Unknown product IDs are supported (they get probed); only known
+    switches/sockets are unsupported. Probing is needed for unknown product IDs
+    and stub device classes.
 
     Source: protocol_docs/04_device_identification_capabilities.md
     """
-    if product_id is None:
-        # Unknown product ID - allow and probe
-        return True
+    info = _DEVICE_INFO.get(product_id)
+    if info is None:
+        info = _device_info(_lookup_capabilities(product_id))
+    return info
 
-    caps = PRODUCT_CAPABILITIES.get(product_id)
-    if caps is None:
-        # Unknown product ID - allow and probe
-        return True
 
-    # Only exclude known switches/sockets
-    if caps.get("is_switch"):
-        return False
+def is_supported_device(product_id: int | None) -> bool:
+    """Check if a device might be supported (not a known switch/socket).
 
-    return True
+    Unknown devices return True since they should be probed for capabilities.
+    Only explicitly-known switches/sockets return False.
+    """
+    return product_id is None or product_id not in _SWITCH_PRODUCT_IDS
 
 
 def needs_capability_probing(product_id: int | None) -> bool:
     """Check if device needs capability probing.
 
     Returns True for unknown product IDs or stub device classes.
-
-    Source: protocol_docs/04_device_identification_capabilities.md
     """
-    if product_id is None:
-        return True
+    return (
+        product_id is None
+        or product_id not in PRODUCT_CAPABILITIES
+        or product_id in _STUB_PRODUCT_IDS
+    )
+
 
-    if product_id not in PRODUCT_CAPABILITIES:
-        return True
+@lru_cache(maxsize=32)
+def _effect_entries(
+    effect_type: EffectType, has_bg_color: bool, has_ic_config: bool
+) -> tuple[tuple[str, int], ...]:
+    """List the (name, encoded effect ID) pairs offered for an effect type.
 
-    return PRODUCT_CAPABILITIES[product_id].get("is_stub", False)
+    Shared by get_effect_list and get_effect_id so the two cannot drift apart.
+    The extra "Sound Reactive" / "Candle Mode" options are not included.
+    """
+    if effect_type == EffectType.SIMPLE:
+        entries = [(name, eid) for eid, name in SIMPLE_EFFECTS.items()]
+    elif effect_type == EffectType.SYMPHONY:
+        if has_ic_config:
+            # True Symphony devices (0xA1-0xAD):
+            # - Settled Mode effects (1-10) via 0x41 command with FG+BG colors,
+            #   encoded with << 8 to distinguish them from Function Mode
+            # - Function Mode effects (1-100) via 0x42 command
+            entries = [(name, eid << 8) for eid, name in SYMPHONY_SETTLED_EFFECTS.items()]
+            entries += [(name, eid) for eid, name in SYMPHONY_EFFECTS.items()]
+        elif has_bg_color:
+            # 0x56/0x80 devices: static effects (ID << 8), regular strip effects,
+            # sound reactive effects ((eid + 0x32) << 8) and Cycle Modes
+            entries = [(name, eid << 8) for eid, name in STATIC_EFFECTS_WITH_BG.items()]
+            entries += [(name, eid) for eid, name in STRIP_EFFECTS.items()]
+            entries += [
+                (name, (eid + 0x32) << 8) for eid, name in SOUND_REACTIVE_EFFECTS.items()
+            ]
+            entries.append(("Cycle Modes", 255))
+        else:
+            # Fallback for unknown Symphony-type devices: numbered effects
+            entries = [(name, eid) for eid, name in SYMPHONY_EFFECTS.items()]
+    elif effect_type == EffectType.ADDRESSABLE_0x53:
+        # 0x53 Ring Light effects (113 effects + Cycle All)
+        entries = [(name, eid) for eid, name in ADDRESSABLE_0x53_EFFECTS.items()]
+    elif effect_type == EffectType.IOTBT:
+        # IOTBT devices have 12 effects via 0xE0 0x02 command, plus 8 music
+        # reactive effects via 0xE1 0x05 command (IDs already << 8 encoded)
+        entries = [(name, eid) for eid, name in IOTBT_EFFECTS.items()]
+        entries += [(name, eid) for eid, name in IOTBT_MUSIC_EFFECTS.items()]
+    elif effect_type == EffectType.IOTBT_SEGMENT:
+        # IOTBT Segment-based devices have 99 effects via 0xE1 0x01 command,
+        # plus the same music reactive effects
+        entries = [(name, eid) for eid, name in IOTBT_SEGMENT_EFFECTS.items()]
+        entries += [(name, eid) for eid, name in IOTBT_MUSIC_EFFECTS.items()]
+    else:
+        entries = []
+    return tuple(entries)
 
 
 def get_effect_list(
@@ -692,8 +800,8 @@ def get_effect_list(
     has_ic_config: bool = False,
     has_builtin_mic: bool = False,
     has_candle_mode: bool = False,
-) -> list[str]:
-    """Get list of effect names for the given effect type.
+) -> tuple[str, ...]:
+    """Get the effect names for the given effect type.
 
     Args:
         effect_type: The effect command type for the device
@@ -703,43 +811,29 @@ def get_effect_list(
         has_candle_mode: If True, include "Candle Mode" option (0x54, 0x5B devices)
 
     Returns:
-        List of effect names
+        Tuple of effect names, shared between calls; use list() for a mutable copy
     """
-    effects = []
+    # The names only depend on the arguments, so build each variant once
+    return _build_effect_list(
+        effect_type, has_bg_color, has_ic_config, has_builtin_mic, has_candle_mode
+    )
 
-    if effect_type == EffectType.SIMPLE:
-        effects = list(SIMPLE_EFFECTS.values())
-    elif effect_type == EffectType.SYMPHONY:
-        if has_ic_config:
-            # True Symphony devices (0xA1-0xAD):
-            # - Settled Mode effects (1-10) via 0x41 command with FG+BG colors
-            # - Function Mode effects (1-100) via 0x42 command
-            effects = list(SYMPHONY_SETTLED_EFFECTS.values())
-            effects.extend(list(SYMPHONY_EFFECTS.values()))
-        elif has_bg_color:
-            # 0x56/0x80 devices: Static effects + Regular effects + Sound reactive
-            effects = list(STATIC_EFFECTS_WITH_BG.values())
-            effects.extend(list(STRIP_EFFECTS.values()))
-            effects.extend(list(SOUND_REACTIVE_EFFECTS.values()))
-            effects.append("Cycle Modes")
-        else:
-            # Fallback for unknown Symphony-type devices: numbered effects
-            effects = list(SYMPHONY_EFFECTS.values())
-    elif effect_type == EffectType.ADDRESSABLE_0x53:
-        # 0x53 Ring Light effects (113 effects + Cycle All)
-        effects = list(ADDRESSABLE_0x53_EFFECTS.values())
-    elif effect_type == EffectType.IOTBT:
-        # IOTBT devices have 12 effects via 0xE0 0x02 command
-        # Plus 8 music reactive effects via 0xE1 0x05 command
-        effects = list(IOTBT_EFFECTS.values())
-        effects.extend(list(IOTBT_MUSIC_EFFECTS.values()))
-    elif effect_type == EffectType.IOTBT_SEGMENT:
-        # IOTBT Segment-based devices have 99 effects via 0xE1 0x01 command
-        effects = list(IOTBT_SEGMENT_EFFECTS.values())
-        effects.extend(list(IOTBT_MUSIC_EFFECTS.values()))
+
+@lru_cache(maxsize=32)
+def _build_effect_list(
+    effect_type: EffectType,
+    has_bg_color: bool,
+    has_ic_config: bool,
+    has_builtin_mic: bool,
+    has_candle_mode: bool,
+) -> tuple[str, ...]:
+    """Build the effect names for get_effect_list."""
+    effects = [
+        name for name, _ in _effect_entries(effect_type, has_bg_color, has_ic_config)
+    ]
 
     # Add sound reactive option for devices with built-in microphone (non-IOTBT)
-    # IOTBT devices have specific music effects listed above instead
+    # IOTBT devices have specific music effects in their entries instead
     if has_builtin_mic and effect_type != EffectType.IOTBT:
         effects.append("Sound Reactive")
 
@@ -747,7 +841,7 @@ def get_effect_list(
     if has_candle_mode:
         effects.append("Candle Mode")
 
-    return effects
+    return tuple(effects)
 
 
 # Special marker for sound reactive mode (not a real effect ID)
@@ -786,66 +880,33 @@ def get_effect_id(
         return SOUND_REACTIVE_MARKER
     if effect_name == "Candle Mode" and has_candle_mode:
         return CANDLE_MODE_MARKER
-    if effect_type == EffectType.SIMPLE:
-        for eid, name in SIMPLE_EFFECTS.items():
-            if name == effect_name:
-                return eid
-    elif effect_type == EffectType.SYMPHONY:
-        if has_ic_config:
-            # True Symphony devices (0xA1-0xAD):
-            # - Settled Mode effects (1-10) via 0x41 command with FG+BG colors
-            # - Function Mode effects (1-100) via 0x42 command
-            # Check Settled Mode effects first (encode with << 8 to distinguish from Function Mode)
-            for eid, name in SYMPHONY_SETTLED_EFFECTS.items():
-                if name == effect_name:
-                    # Encode Settled effects with << 8 to distinguish from Function Mode
-                    return eid << 8
-            # Then check Function Mode effects (1-100)
-            for eid, name in SYMPHONY_EFFECTS.items():
-                if name == effect_name:
-                    return eid
-        elif has_bg_color:
-            # 0x56/0x80 devices: Check static effects, strip effects, sound reactive
-            for eid, name in STATIC_EFFECTS_WITH_BG.items():
-                if name == effect_name:
-                    # Static effects use ID << 8 to distinguish from regular effects
-                    return eid << 8
-            for eid, name in STRIP_EFFECTS.items():
-                if name == effect_name:
-                    return eid
-            for eid, name in SOUND_REACTIVE_EFFECTS.items():
-                if name == effect_name:
-                    # Sound reactive effects use (eid + 0x32) << 8
-                    return (eid + 0x32) << 8
-            if effect_name == "Cycle Modes":
-                return 255
-        else:
-            # Fallback for unknown Symphony-type devices: numbered effects
-            for eid, name in SYMPHONY_EFFECTS.items():
-                if name == effect_name:
-                    return eid
-    elif effect_type == EffectType.ADDRESSABLE_0x53:
-        for eid, name in ADDRESSABLE_0x53_EFFECTS.items():
-            if name == effect_name:
-                return eid
-    elif effect_type == EffectType.IOTBT:
-        # Regular effects (1-12)
-        for eid, name in IOTBT_EFFECTS.items():
-            if name == effect_name:
-                return eid
-        # Music reactive effects (encoded as effect_num << 8)
-        for eid, name in IOTBT_MUSIC_EFFECTS.items():
-            if name == effect_name:
-                return eid  # Already encoded (e.g., 0x100 for Music 1)
-    elif effect_type == EffectType.IOTBT_SEGMENT:
-        # Segment-based effects (1-99) via 0xE1 0x01 command
-        for eid, name in IOTBT_SEGMENT_EFFECTS.items():
-            if name == effect_name:
-                return eid
-        for eid, name in IOTBT_MUSIC_EFFECTS.items():
-            if name == effect_name:
-                return eid  # Already encoded (e.g., 0x100 for Music 1)
-    return None
+    return _effect_ids_by_name(effect_type, has_bg_color, has_ic_config).get(effect_name)
+
+
+@lru_cache(maxsize=32)
+def _effect_ids_by_name(
+    effect_type: EffectType, has_bg_color: bool, has_ic_config: bool
+) -> dict[str, int]:
+    """Build the name -> effect ID map used by get_effect_id.
+
+    The first ID listed for a name wins, matching the order of get_effect_list.
+    """
+    ids: dict[str, int] = {}
+    for name, eid in _effect_entries(effect_type, has_bg_color, has_ic_config):
+        ids.setdefault(name, eid)
+    return ids
+
+
+# Precomputed conversion tables for the advertisement hot path.
+# _PCT_TO_255[pct] == int(pct * 255 / 100) for pct in 0-100.
+_PCT_TO_255: Final = tuple(int(pct * 255 / 100) for pct in range(101))
+# _RAW255_TO_PCT[raw] == int(raw * 100 / 255) for raw in 0-255.
+_RAW255_TO_PCT: Final = tuple(int(raw * 100 / 255) for raw in range(256))
+# _INVERTED_31_TO_PCT[raw] for raw in 0x00-0x1F; 0x00 is treated as 0x01 (fastest).
+# Formula from model_0x54.py: speed% = round((0x1f - speed_raw) * (100 - 1) / (0x1f - 0x01) + 1)
+_INVERTED_31_TO_PCT: Final = tuple(
+    round((0x1F - max(raw, 0x01)) * 99 / 30 + 1) for raw in range(0x20)
+)
 
 
 def get_brightness_scale(product_id: int | None) -> ValueScale:
@@ -863,6 +924,7 @@ def get_brightness_scale(product_id: int | None) -> ValueScale:
     # Currently all known devices use percentage scale for brightness
     # The > 100 values we saw were likely bugs or malformed data
     # Per protocol docs and old integration, manufacturer data should be 0-100
+    # convert_brightness_from_adv assumes this; update it if that changes
     return ValueScale.PERCENT
 
 
@@ -878,7 +940,8 @@ def get_speed_scale(product_id: int | None) -> ValueScale:
     Returns:
         ValueScale indicating how to interpret speed values
     """
-    if product_id is not None and product_id in INVERTED_SPEED_PRODUCT_IDS:
+    # convert_speed_from_adv tests INVERTED_SPEED_PRODUCT_IDS the same way
+    if product_id in INVERTED_SPEED_PRODUCT_IDS:
         return ValueScale.INVERTED_31
     return ValueScale.PERCENT
 
@@ -893,24 +956,17 @@ def convert_brightness_from_adv(raw_value: int, product_id: int | None) -> int:
     Returns:
         Brightness value in 0-255 range
     """
-    scale = get_brightness_scale(product_id)
-
-    if scale == ValueScale.RAW_255:
-        # Value is already 0-255
-        return max(0, min(255, raw_value))
-    elif scale == ValueScale.PERCENT:
-        # Value is 0-100 percentage, convert to 0-255
-        # Handle potential overflow (device reporting 0-255 when we expect 0-100)
-        if raw_value > 100:
-            _LOGGER.debug(
-                "Brightness %d exceeds expected 0-100 range for product_id=0x%02X, "
-                "treating as raw 0-255 value",
-                raw_value, product_id or 0
-            )
-            return max(0, min(255, raw_value))
-        return int(raw_value * 255 / 100)
-
-    return max(0, min(255, raw_value))
+    # All known devices report a 0-100 percentage (see get_brightness_scale), so
+    # convert it to 0-255 directly since this runs for every advertisement.
+    # Handle potential overflow (device reporting 0-255 when we expect 0-100)
+    if raw_value > 100:
+        _LOGGER.debug(
+            "Brightness %d exceeds expected 0-100 range for product_id=0x%02X, "
+            "treating as raw 0-255 value",
+            raw_value, product_id or 0
+        )
+        return min(raw_value, 255)
+    return _PCT_TO_255[raw_value] if raw_value >= 0 else 0
 
 
 def convert_speed_from_adv(raw_value: int, product_id: int | None) -> int:
@@ -923,28 +979,24 @@ def convert_speed_from_adv(raw_value: int, product_id: int | None) -> int:
     Returns:
         Speed value in 0-100 range
     """
-    scale = get_speed_scale(product_id)
-
-    if scale == ValueScale.INVERTED_31:
+    # Same rule as get_speed_scale, tested directly since this runs for every
+    # advertisement
+    if product_id in INVERTED_SPEED_PRODUCT_IDS:
         # 0x54/0x55/0x62/0x5B: inverted 0x01-0x1F scale
         # 0x01 = 100% (fastest), 0x1F = ~3% (slowest)
-        # Formula from model_0x54.py: speed% = round((0x1f - speed_raw) * (100 - 1) / (0x1f - 0x01) + 1)
         if raw_value < 0x01:
             raw_value = 0x01
         elif raw_value > 0x1F:
             raw_value = 0x1F
-        speed_pct = round((0x1F - raw_value) * 99 / 30 + 1)
-        return max(0, min(100, speed_pct))
-    elif scale == ValueScale.PERCENT:
-        # Value is 0-100 percentage
-        # Handle potential overflow (device reporting 0-255 when we expect 0-100)
-        if raw_value > 100:
-            _LOGGER.debug(
-                "Speed %d exceeds expected 0-100 range for product_id=0x%02X, "
-                "converting from 0-255 to 0-100",
-                raw_value, product_id or 0
-            )
-            return int(raw_value * 100 / 255)
-        return max(0, min(100, raw_value))
+        return _INVERTED_31_TO_PCT[raw_value]
 
-    return max(0, min(100, raw_value))
+    # Value is 0-100 percentage
+    # Handle potential overflow (device reporting 0-255 when we expect 0-100)
+    if raw_value > 100:
+        _LOGGER.debug(
+            "Speed %d exceeds expected 0-100 range for product_id=0x%02X, "
+            "converting from 0-255 to 0-100",
+            raw_value, product_id or 0
+        )
+        return _RAW255_TO_PCT[raw_value] if raw_value <= 0xFF else 100
+    return max(raw_value, 0)
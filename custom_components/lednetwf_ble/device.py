@@ -24,8 +24,7 @@ from .const import (
     MIN_KELVIN,
     MAX_KELVIN,
     EffectType,
-    get_device_capabilities,
-    needs_capability_probing,
+    resolve_device,
     get_effect_list,
     get_effect_id,
     convert_brightness_from_adv,
@@ -81,6 +80,9 @@ class LEDNetWFDevice:
         self._disconnect_timer: asyncio.TimerHandle | None = None
         self._seq: int = 0
         self._connect_lock = asyncio.Lock()
+        # Serialises writes so concurrent callers (e.g. the config flow test
+        # pattern overlapping the LED settings query) can't interleave them
+        self._write_lock = asyncio.Lock()
 
         # Device state
         self._is_on: bool | None = None
@@ -124,8 +126,8 @@ class LEDNetWFDevice:
         # Callbacks for state updates
         self._callbacks: list[Callable[[], None]] = []
 
-        # Cache capabilities
-        self._capabilities = get_device_capabilities(product_id)
+        # Cache capabilities (copied: probing updates them in place)
+        self._capabilities = dict(resolve_device(product_id).caps)
 
         # Log initial device setup
         _LOGGER.debug(
@@ -142,7 +144,7 @@ class LEDNetWFDevice:
 
         # Response waiting mechanism for probing
         self._pending_state_response: asyncio.Event | None = None
-        self._last_state_response: dict | None = None
+        self._last_state_response: protocol.StateResponse | None = None
 
     @property
     def address(self) -> str:
@@ -261,8 +263,8 @@ class LEDNetWFDevice:
         return EffectType(val) if isinstance(val, int) else val
 
     @property
-    def effect_list(self) -> list[str]:
-        """Return list of available effects."""
+    def effect_list(self) -> tuple[str, ...]:
+        """Return the available effects."""
         return get_effect_list(
             self.effect_type, self.has_bg_color, self.has_ic_config,
             self.has_builtin_mic, self.has_candle_mode
@@ -880,24 +882,26 @@ class LEDNetWFDevice:
 
         # Store result for probing - DeviceState2 format provides limited info
         # but we need to populate _last_state_response for probe_capabilities() to work
-        self._last_state_response = {
-            "is_on": is_on,
-            "mode": mode,
-            "mesh_address": address,
+        self._last_state_response = protocol.StateResponse(
+            is_on=is_on,
+            mode_type=mode,
+            sub_mode=0,
+            value1=0,
             # IOTBT doesn't provide RGB values in a usable format
             # Set to 0 so probing doesn't think colors changed
-            "r": 0,
-            "g": 0,
-            "b": 0,
-            "ww": 0,
-            "cw": 0,
+            r=0,
+            g=0,
+            b=0,
+            ww=0,
+            cw=0,
+            led_version=0,
+            effect_id=None,
             # Mode flags for compatibility with standard state response parsing
-            "is_rgb_mode": False,
-            "is_white_mode": False,
-            "is_effect_mode": mode not in (0x23, 0x24),  # Anything besides power states
-            "mode_type": mode,
-            "sub_mode": 0,
-        }
+            is_effect_mode=mode not in (0x23, 0x24),  # Anything besides power states
+            is_rgb_mode=False,
+            is_white_mode=False,
+            color_order_nibble=0,
+        )
 
         # Signal waiting coroutine if any
         if self._pending_state_response:
@@ -924,28 +928,28 @@ class LEDNetWFDevice:
         if self._pending_state_response:
             self._pending_state_response.set()
 
-        self._is_on = result["is_on"]
+        self._is_on = result.is_on
 
         # Debug: trace which condition will match
         _LOGGER.debug(
             "State parse conditions: is_effect=%s, is_white=%s, is_rgb=%s, "
             "has_ic_config=%s, effect_type=%s (SIMPLE=%s), mode_type=0x%02X",
-            result.get("is_effect_mode"), result.get("is_white_mode"), result.get("is_rgb_mode"),
+            result.is_effect_mode, result.is_white_mode, result.is_rgb_mode,
             self.has_ic_config, self.effect_type, self.effect_type == EffectType.SIMPLE,
-            result["mode_type"]
+            result.mode_type
         )
 
         # Handle different modes
-        if result.get("is_effect_mode"):
+        if result.is_effect_mode:
             # Effect mode (mode_type=0x25) - this is Function Mode for Symphony devices
             # For has_ic_config devices, effect_id 1-100 are Function Mode effects
             # NOT Settled Mode effects (which report mode_type=0x61)
             if self.has_ic_config:
                 # Function Mode effects: use SYMPHONY_EFFECTS directly (bypass _effect_id_to_name)
                 from .const import SYMPHONY_EFFECTS
-                self._effect = SYMPHONY_EFFECTS.get(result["effect_id"])
+                self._effect = SYMPHONY_EFFECTS.get(result.effect_id)
             else:
-                self._effect = self._effect_id_to_name(result["effect_id"])
+                self._effect = self._effect_id_to_name(result.effect_id)
             self._color_temp_kelvin = None
 
             if self.effect_type == EffectType.SYMPHONY and self.has_ic_config:
@@ -953,10 +957,10 @@ class LEDNetWFDevice:
                 # - Brightness in byte 6 (R position), 1-100 scale
                 # - Speed in byte 5 (value1), stored as speed_byte × 3
                 # - speed_byte is 1-31 (1=slow, 31=fast)
-                brightness_pct = result["r"] if result["r"] > 0 else 100
+                brightness_pct = result.r if result.r > 0 else 100
                 self._brightness = int(brightness_pct * 255 / 100)
                 # Convert speed: value1 = speed_byte × 3, speed_byte is 1-31 (1=slow, 31=fast)
-                raw_value1 = result["value1"]
+                raw_value1 = result.value1
                 if raw_value1 > 0:
                     speed_byte = raw_value1 // 3
                     # Clamp to valid range 1-31
@@ -968,30 +972,30 @@ class LEDNetWFDevice:
                 # ADDRESSABLE_0x53 and others:
                 # - Brightness from byte 6 (R position), 0-100 scale
                 # - Speed from byte 7 (G position), 0-100 scale
-                self._brightness = int(result["r"] * 255 / 100) if result["r"] <= 100 else result["r"]
-                self._effect_speed = result["g"] if result["g"] <= 100 else int(result["g"] * 100 / 255)
+                self._brightness = int(result.r * 255 / 100) if result.r <= 100 else result.r
+                self._effect_speed = result.g if result.g <= 100 else int(result.g * 100 / 255)
 
             _LOGGER.debug("Effect mode: effect_id=%s, brightness=%d, speed=%d (value1=%d, r=%d, g=%d)",
-                          result["effect_id"], self._brightness, self._effect_speed,
-                          result["value1"], result["r"], result["g"])
+                          result.effect_id, self._brightness, self._effect_speed,
+                          result.value1, result.r, result.g)
 
-        elif result.get("is_white_mode"):
+        elif result.is_white_mode:
             # White/CCT mode - brightness from value1 (byte 5), scaled 0-100 → 0-255
             self._effect = None
             self._rgb = None
-            self._brightness = int(result["value1"] * 255 / 100)
+            self._brightness = int(result.value1 * 255 / 100)
             # Color temp from byte 9 (ww position), 0-100%
             # Per protocol: 0% = 2700K (warm), 100% = 6500K (cool)
-            temp_pct = result["ww"]
+            temp_pct = result.ww
             self._color_temp_kelvin = int(MIN_KELVIN + temp_pct * (MAX_KELVIN - MIN_KELVIN) / 100)
             _LOGGER.debug("White mode: brightness=%d (value1=%d), color_temp=%dK (pct=%d)",
-                          self._brightness, result["value1"], self._color_temp_kelvin, temp_pct)
+                          self._brightness, result.value1, self._color_temp_kelvin, temp_pct)
 
         elif (self._capabilities.get("has_dim") and
-              result["mode_type"] == 0x61):
+              result.mode_type == 0x61):
             # Dimmer-only device (Ctrl_Dim, Bulb_Dim, Magnetic_Dim):
             # Brightness is reported in the R channel value (0-255)
-            r = result["r"]
+            r = result.r
             self._brightness = max(r, 1) if r > 0 else 0
             self._rgb = None
             self._color_temp_kelvin = None
@@ -1000,7 +1004,7 @@ class LEDNetWFDevice:
                           r, self._brightness)
 
         elif (self.effect_type == EffectType.SIMPLE and
-              result["mode_type"] == 0x61):
+              result.mode_type == 0x61):
             # SIMPLE devices: mode_type=0x61 is RGB mode regardless of sub_mode
             # sub_mode often echoes power state (0x23=ON, 0x24=OFF) rather than mode info
             # Must check BEFORE is_rgb_mode since SIMPLE sub_modes don't match standard RGB sub_modes
@@ -1008,12 +1012,12 @@ class LEDNetWFDevice:
             # Don't clear effect for SIMPLE devices - they report 0x61 even when running effects
 
             # Extract color order from upper nibble if device supports it
-            if self.has_color_order and "color_order_nibble" in result:
-                color_order = result["color_order_nibble"]
+            if self.has_color_order:
+                color_order = result.color_order_nibble
                 if 1 <= color_order <= 3:  # Valid range: 1=RGB, 2=GRB, 3=BRG
                     self._color_order = color_order
 
-            r, g, b = result["r"], result["g"], result["b"]
+            r, g, b = result.r, result.g, result.b
             h, s, v = protocol.rgb_to_hsv(r, g, b)
             brightness_raw = round(v * 255 / 100)
             if brightness_raw == 0 and (r > 0 or g > 0 or b > 0):
@@ -1034,15 +1038,15 @@ class LEDNetWFDevice:
                 self._rgb = (r, g, b)
 
             _LOGGER.debug("SIMPLE RGB mode (0x61/0x%02X): device_rgb=(%d,%d,%d), pure_rgb=%s, brightness=%d, color_order=%s",
-                          result["sub_mode"], r, g, b, self._rgb, self._brightness, self._color_order)
+                          result.sub_mode, r, g, b, self._rgb, self._brightness, self._color_order)
 
         elif (self.effect_type == EffectType.SIMPLE and
-              result["mode_type"] == 0x03):
+              result.mode_type == 0x03):
             # SIMPLE devices: mode_type=0x03 is initialization/standby state
             # Device reports this on power-on before any color has been set
             # Treat as RGB mode with current RGB values (usually black)
             self._color_temp_kelvin = None
-            r, g, b = result["r"], result["g"], result["b"]
+            r, g, b = result.r, result.g, result.b
             h, s, v = protocol.rgb_to_hsv(r, g, b)
             brightness_raw = round(v * 255 / 100)
             if brightness_raw == 0 and (r > 0 or g > 0 or b > 0):
@@ -1070,13 +1074,13 @@ class LEDNetWFDevice:
                     self._rgb = (r, g, b)
 
             _LOGGER.debug("SIMPLE init mode (0x03/0x%02X): device_rgb=(%d,%d,%d), pure_rgb=%s, brightness=%d",
-                          result["sub_mode"], r, g, b, self._rgb, self._brightness)
+                          result.sub_mode, r, g, b, self._rgb, self._brightness)
 
-        elif result.get("is_rgb_mode"):
+        elif result.is_rgb_mode:
             # RGB mode - brightness derived from RGB via HSV conversion
             self._effect = None
             self._color_temp_kelvin = None
-            r, g, b = result["r"], result["g"], result["b"]
+            r, g, b = result.r, result.g, result.b
             # Device returns RGB pre-scaled by brightness. Extract H, S, V
             # then reconstruct "pure" color at full brightness for the color picker.
             h, s, v = protocol.rgb_to_hsv(r, g, b)
@@ -1106,17 +1110,17 @@ class LEDNetWFDevice:
                           r, g, b, self._rgb, self._brightness, h, s, v)
 
         elif (self.has_ic_config and
-              result["mode_type"] == 0x61 and
-              1 <= result["sub_mode"] <= 10):
+              result.mode_type == 0x61 and
+              1 <= result.sub_mode <= 10):
             # Settled Mode effect for Symphony devices (has_ic_config)
             # mode_type=0x61 with sub_mode=1-10 indicates Settled effect
             # RGB contains the foreground color
             from .const import SYMPHONY_SETTLED_EFFECTS
-            effect_id = result["sub_mode"]
+            effect_id = result.sub_mode
             self._effect = SYMPHONY_SETTLED_EFFECTS.get(effect_id)
             self._color_temp_kelvin = None
 
-            r, g, b = result["r"], result["g"], result["b"]
+            r, g, b = result.r, result.g, result.b
             # Derive brightness from RGB via HSV
             h, s, v = protocol.rgb_to_hsv(r, g, b)
             brightness_raw = round(v * 255 / 100)
@@ -1139,33 +1143,33 @@ class LEDNetWFDevice:
                 self._rgb = (r, g, b)
 
             # Speed from value1 (if available)
-            if result["value1"] > 0:
-                self._effect_speed = min(100, result["value1"])
+            if result.value1 > 0:
+                self._effect_speed = min(100, result.value1)
 
             _LOGGER.debug("Settled effect mode: effect=%s (id=%d), fg_rgb=%s, pure_rgb=%s, brightness=%d, speed=%d",
                           self._effect, effect_id, (r, g, b), self._rgb, self._brightness, self._effect_speed)
 
-        elif result["mode_type"] in (0x5D, 0x62) and self.has_builtin_mic:
+        elif result.mode_type in (0x5D, 0x62) and self.has_builtin_mic:
             # Sound reactive mode (built-in microphone)
             # Device is listening to ambient audio and controlling LEDs autonomously
             # Mode 0x5D (93) is used by SIMPLE devices (e.g., product 0x08 Ctrl_Mini_RGB_Mic)
             # Mode 0x62 (98) is used by Symphony devices with built-in mic
             self._effect = "Sound Reactive"
             self._color_temp_kelvin = None
-            _LOGGER.debug("Sound reactive mode detected (mode_type=0x%02X)", result["mode_type"])
+            _LOGGER.debug("Sound reactive mode detected (mode_type=0x%02X)", result.mode_type)
 
-        elif 37 <= result["mode_type"] <= 56 and self.effect_type == EffectType.SIMPLE:
+        elif 37 <= result.mode_type <= 56 and self.effect_type == EffectType.SIMPLE:
             # SIMPLE effect mode - mode_type IS the effect ID (37-56)
             # State response for SIMPLE devices running effects like "White strobe flash" (55)
             # will have mode_type = 0x37 (55 decimal)
-            effect_id = result["mode_type"]
+            effect_id = result.mode_type
             self._effect = self._effect_id_to_name(effect_id)
             self._color_temp_kelvin = None
 
             # For SIMPLE effects, speed is in value1 (byte 5), NOT sub_mode (byte 4)
             # sub_mode echoes power state (0x23) and is unreliable for speed
             # value1 contains speed in protocol format (1-31, where 1=fastest, 31=slowest)
-            raw_speed = result["value1"]
+            raw_speed = result.value1
             if 1 <= raw_speed <= 31:
                 # Convert 1-31 to 0-100 (1=fastest=100%, 31=slowest=0%)
                 self._effect_speed = int((31 - raw_speed) * 100 / 30)
@@ -1187,7 +1191,7 @@ class LEDNetWFDevice:
             if self.effect_type != EffectType.SIMPLE:
                 self._effect = None
 
-            r, g, b = result["r"], result["g"], result["b"]
+            r, g, b = result.r, result.g, result.b
             # Device returns RGB pre-scaled by brightness. Extract H, S, V
             h, s, v = protocol.rgb_to_hsv(r, g, b)
 
@@ -1206,7 +1210,7 @@ class LEDNetWFDevice:
             else:
                 self._rgb = (r, g, b)
             _LOGGER.debug("Unknown mode (0x%02X/0x%02X): device_rgb=(%d,%d,%d), pure_rgb=%s, brightness=%d (SIMPLE=%s, effect=%s)",
-                          result["mode_type"], result["sub_mode"], r, g, b, self._rgb, self._brightness,
+                          result.mode_type, result.sub_mode, r, g, b, self._rgb, self._brightness,
                           self.effect_type == EffectType.SIMPLE, self._effect)
 
         _LOGGER.debug("Parsed state: on=%s, rgb=%s, cct=%s, effect=%s, brightness=%s",
@@ -1308,19 +1312,20 @@ class LEDNetWFDevice:
         try:
             client = await self._ensure_connected()
 
-            # Update sequence number in packet
-            self._seq = (self._seq + 1) % 256
-            packet[1] = self._seq
+            async with self._write_lock:
+                # Update sequence number in packet
+                self._seq = (self._seq + 1) % 256
+                packet[1] = self._seq
 
-            # Format as 0xNN for debugging
-            pkt_hex = ' '.join(f'0x{b:02X}' for b in packet)
-            _LOGGER.debug("Sending to %s: %s", self._name, pkt_hex)
+                # Format as 0xNN for debugging
+                pkt_hex = ' '.join(f'0x{b:02X}' for b in packet)
+                _LOGGER.debug("Sending to %s: %s", self._name, pkt_hex)
 
-            await client.write_gatt_char(
-                WRITE_CHARACTERISTIC_UUID,
-                packet,
-                response=with_response,
-            )
+                await client.write_gatt_char(
+                    WRITE_CHARACTERISTIC_UUID,
+                    packet,
+                    response=with_response,
+                )
             return True
 
         except BleakError as ex:
@@ -1731,13 +1736,11 @@ class LEDNetWFDevice:
                     break
         if effect_id is None:
             # Fallback: try to extract from effect name like "Static Effect 3"
+            effect_id = 2  # Default to Static Effect 2
             if self._effect and self._effect.startswith("Static Effect "):
-                try:
-                    effect_id = int(self._effect.split()[-1])
-                except ValueError:
-                    effect_id = 2  # Default to Static Effect 2
-            else:
-                effect_id = 2  # Default
+                number = self._effect.split()[-1]
+                if number.isdecimal():
+                    effect_id = int(number)
 
         # Scale BG RGB by brightness
         scale = brightness / 255.0
@@ -1786,7 +1789,7 @@ class LEDNetWFDevice:
             packet = protocol.build_state_query()
         return await self._send_command(packet)
 
-    async def query_state_and_wait(self, timeout: float = 3.0) -> dict | None:
+    async def query_state_and_wait(self, timeout: float = 3.0) -> protocol.StateResponse | None:
         """Query device state and wait for response.
 
         This sends a state query and waits for the response. The notification
@@ -1797,7 +1800,7 @@ class LEDNetWFDevice:
             timeout: Maximum seconds to wait for response
 
         Returns:
-            Parsed state response dict, or None if timeout/error
+            Parsed StateResponse, or None if timeout/error
         """
         return await self._query_state_and_wait(timeout)
 
@@ -2158,37 +2161,32 @@ class LEDNetWFDevice:
                 _LOGGER.debug(
                     "[%s] Raw service data (%d bytes): %s",
                     self._name, len(sd_bytes),
-                    ' '.join(f'{b:02X}' for b in sd_bytes[:20])  # First 20 bytes
+                    sd_bytes[:20].hex(' ').upper()  # First 20 bytes
                 )
                 sd_result = protocol.parse_service_data(sd_bytes)
                 if sd_result:
-                    # Update device info from service data
-                    if sd_result.get("ble_version") is not None:
-                        self._ble_version = sd_result["ble_version"]
-                    if sd_result.get("led_version") is not None:
-                        self._led_version = sd_result["led_version"]
-                    if sd_result.get("firmware_ver") is not None:
-                        self._firmware_ver = sd_result["firmware_ver"]
-                    if sd_result.get("firmware_flag") is not None:
-                        self._firmware_flag = sd_result["firmware_flag"]
-                    if sd_result.get("firmware_ver_str"):
-                        self._fw_version = sd_result["firmware_ver_str"]
+                    # Update device info from service data (always present in both formats)
+                    self._ble_version = sd_result.ble_version
+                    self._led_version = sd_result.led_version
+                    self._firmware_ver = sd_result.firmware_ver
+                    self._firmware_flag = sd_result.firmware_flag
+                    self._fw_version = sd_result.firmware_ver_str
                     # Auto-detect Telink vs segment within the 0x5A00 IOTBT family from
                     # the stable flags2 byte (status 0x56 also indicates segment). The
                     # manual override, applied in the is_iotbt_segment property, wins.
-                    if sd_result.get("flags2") is not None:
-                        self._iotbt_flags2 = sd_result["flags2"]
+                    if sd_result.flags2 is not None:
+                        self._iotbt_flags2 = sd_result.flags2
                     if self.is_iotbt:
                         seg = (
-                            protocol.is_iotbt_segment_from_flags2(sd_result.get("flags2"))
-                            or sd_result.get("sta") == 0x56
+                            protocol.is_iotbt_segment_from_flags2(sd_result.flags2)
+                            or sd_result.sta == 0x56
                         )
                         if seg != self._is_iotbt_segment:
                             self._is_iotbt_segment = seg
                             _LOGGER.info(
                                 "[%s] IOTBT auto-detected as %s (flags2=0x%02X, sta=0x%02X)",
                                 self._name, "segment" if seg else "telink",
-                                sd_result.get("flags2") or 0, sd_result.get("sta") or 0,
+                                sd_result.flags2 or 0, sd_result.sta or 0,
                             )
                     _LOGGER.debug(
                         "[%s] Service data: ble_v=%s, led_v=%s, fw_ver=%s, fw_flag=%s",
@@ -2221,18 +2219,20 @@ class LEDNetWFDevice:
         changed = False
 
         # Power state
-        if result.get("power_state") is not None:
-            if self._is_on != result["power_state"]:
-                self._is_on = result["power_state"]
-                changed = True
+        power_state = result.get("power_state")
+        if power_state is not None and self._is_on != power_state:
+            self._is_on = power_state
+            changed = True
 
         # Firmware version and BLE version from manufacturer data
-        if result.get("fw_version"):
-            self._fw_version = result["fw_version"]
+        fw_version = result.get("fw_version")
+        if fw_version:
+            self._fw_version = fw_version
         # Also extract BLE version from manufacturer data if not already set from service data
         # BLE version is byte 1 of manufacturer data and indicates firmware capabilities
-        if result.get("ble_version") is not None and self._ble_version is None:
-            self._ble_version = result["ble_version"]
+        ble_version = result.get("ble_version")
+        if ble_version is not None and self._ble_version is None:
+            self._ble_version = ble_version
             _LOGGER.debug(
                 "[%s] BLE version from manufacturer data: %d",
                 self._name, self._ble_version
@@ -2409,14 +2409,14 @@ class LEDNetWFDevice:
 
         return changed
 
-    async def _query_state_and_wait(self, timeout: float = 3.0) -> dict | None:
+    async def _query_state_and_wait(self, timeout: float = 3.0) -> protocol.StateResponse | None:
         """Send state query and wait for response.
 
         Args:
             timeout: Maximum seconds to wait for response
 
         Returns:
-            Parsed state response dict, or None if timeout/error
+            Parsed StateResponse, or None if timeout/error
         """
         self._pending_state_response = asyncio.Event()
         self._last_state_response = None
@@ -2480,11 +2480,11 @@ class LEDNetWFDevice:
                 return detected
 
             # Save original values to restore
-            original_r = initial_state.get("r", 0)
-            original_g = initial_state.get("g", 0)
-            original_b = initial_state.get("b", 0)
-            original_ww = initial_state.get("ww", 0)
-            original_cw = initial_state.get("cw", 0)
+            original_r = initial_state.r
+            original_g = initial_state.g
+            original_b = initial_state.b
+            original_ww = initial_state.ww
+            original_cw = initial_state.cw
 
             # Step 2: Test RGB by setting red to 0x32 (50)
             _LOGGER.debug("Testing RGB capability...")
@@ -2492,7 +2492,7 @@ class LEDNetWFDevice:
             if await self._send_command(test_cmd):
                 await asyncio.sleep(0.3)  # Give device time to apply
                 state = await self._query_state_and_wait()
-                if state and state.get("r", 0) >= 0x30:  # Allow some tolerance
+                if state and state.r >= 0x30:  # Allow some tolerance
                     detected["has_rgb"] = True
                     _LOGGER.debug("RGB capability detected")
 
@@ -2502,7 +2502,7 @@ class LEDNetWFDevice:
             if await self._send_command(test_cmd):
                 await asyncio.sleep(0.3)
                 state = await self._query_state_and_wait()
-                if state and state.get("ww", 0) >= 0x30:
+                if state and state.ww >= 0x30:
                     detected["has_ww"] = True
                     _LOGGER.debug("WW capability detected")
 
@@ -2512,7 +2512,7 @@ class LEDNetWFDevice:
             if await self._send_command(test_cmd):
                 await asyncio.sleep(0.3)
                 state = await self._query_state_and_wait()
-                if state and state.get("cw", 0) >= 0x30:
+                if state and state.cw >= 0x30:
                     detected["has_cw"] = True
                     _LOGGER.debug("CW capability detected")
 
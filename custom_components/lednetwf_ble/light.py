@@ -146,7 +146,7 @@ class LEDNetWFLight(LightEntity):
     def effect_list(self) -> list[str] | None:
         """Return list of effects."""
         effects = self._device.effect_list
-        return effects if effects else None
+        return list(effects) if effects else None
 
     @property
     def effect(self) -> str | None:
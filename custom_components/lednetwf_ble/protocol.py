@@ -11,9 +11,11 @@ from __future__ import annotations
 
 import colorsys
 import logging
-from typing import Tuple
+import struct
+from functools import lru_cache
+from typing import Callable, NamedTuple, Tuple
 
-from .const import EffectType, MIN_KELVIN, MAX_KELVIN, SYMPHONY_BG_COLOR_EFFECTS
+from .const import EffectType, MIN_KELVIN, MAX_KELVIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -1488,7 +1490,76 @@ def build_sound_reactive_symphony(
 # RESPONSE PARSING
 # =============================================================================
 
-def parse_state_response(data: bytes) -> dict | None:
+def _build_byte_table(entries: dict[int, str]) -> tuple[str | None, ...]:
+    """Build a 256-entry byte -> kind lookup table (None for unlisted bytes)."""
+    table: list[str | None] = [None] * 256
+    for value, kind in entries.items():
+        table[value] = kind
+    return tuple(table)
+
+
+# Static-mode sub_mode values that report an RGB color
+_RGB_SUB_MODES = frozenset({0xF0, 0x01, 0x0B})
+
+# Sub-mode byte classification when mode_type is 0x61 (static).
+# _RGB_SUB_MODES = RGB, 0x0F = white/CCT, 0x23/0x24 = power on/off,
+# 2-10 = Symphony Settled Mode effect (1 is claimed by RGB).
+_SUB_MODE_KIND = _build_byte_table({
+    **{i: "settled" for i in range(2, 11)},
+    **{i: "rgb" for i in _RGB_SUB_MODES},
+    0x0F: "cct",
+    0x23: "standby",
+    0x24: "off",
+})
+
+# Mode-type byte classification.
+# 0x61 = static color/white, 0x25 = effect, 37-56 = SIMPLE effect ID carried in
+# mode_type itself (0x25 == 37 stays "effect"), 0x5D/0x62 = sound reactive.
+_MODE_TYPE_KIND = _build_byte_table({
+    **{i: "simple_effect" for i in range(37, 57)},
+    0x61: "static",
+    0x25: "effect",
+    0x5D: "sound_reactive", 0x62: "sound_reactive",
+})
+
+# Effect ID for an effect-mode (0x25) sub_mode byte. SIMPLE effects 37-56 are
+# reported offset by 20 (sub_mode 17-36); every other value is the ID itself.
+_EFFECT_ID_FROM_SUB_MODE = tuple(i + 20 if 17 <= i <= 36 else i for i in range(256))
+
+# Advertised power byte -> power state (0x23 = on, 0x24 = off, else unknown)
+_POWER_MAP: dict[int, bool] = {0x23: True, 0x24: False}
+
+
+# 16-bit field readers for the LED settings responses
+_U16_BE = struct.Struct(">H")
+_U16_LE = struct.Struct("<H")
+
+# 0x81 state response bytes 2-11: power, mode_type, sub_mode, value1,
+# r, g, b, ww, led_version, cw (header/mode/reserved/checksum skipped)
+_STATE_RESPONSE_FORMAT = struct.Struct("2x10B")
+
+
+class StateResponse(NamedTuple):
+    """Parsed 0x81 state query response (see parse_state_response)."""
+
+    is_on: bool
+    mode_type: int
+    sub_mode: int
+    value1: int
+    r: int
+    g: int
+    b: int
+    ww: int
+    cw: int
+    led_version: int
+    effect_id: int | None
+    is_effect_mode: bool
+    is_rgb_mode: bool
+    is_white_mode: bool
+    color_order_nibble: int
+
+
+def parse_state_response(data: bytes) -> StateResponse | None:
     """
     Parse state query response (0x81 format).
 
@@ -1514,7 +1585,7 @@ def parse_state_response(data: bytes) -> dict | None:
         - White mode: from value1 (byte 5), scaled 0-100 → 0-255
         - Effect mode: from byte 6 (R position), scaled 0-100 → 0-255
 
-    Returns dict with:
+    Returns StateResponse with:
         - is_on: bool
         - mode_type: int (0x61=static, 0x25=effect)
         - sub_mode: int (0xF0/0x0B=RGB, 0x0F=white, or effect ID)
@@ -1526,70 +1597,59 @@ def parse_state_response(data: bytes) -> dict | None:
         - is_effect_mode: bool
         - is_rgb_mode: bool
         - is_white_mode: bool
+        - color_order_nibble: int (upper nibble of sub_mode)
     """
     if len(data) < 14 or data[0] != 0x81:
         return None
 
-    # Byte 2: Power state (0x23 = on)
-    is_on = data[2] == 0x23
-
-    # Byte 3: Mode type
-    # 0x61 (97) = static color/white mode
-    # 0x25 (37) = effect mode
-    mode_type = data[3]
+    # Bytes 2-11 in one C-level unpack:
+    #   Byte 2: Power state (0x23 = on)
+    #   Byte 3: Mode type - 0x61 (97) = static color/white, 0x25 (37) = effect
+    #   Byte 4: Sub-mode - static: 0xF0/0x01/0x0B = RGB, 0x0F = white;
+    #           effect: effect ID; SIMPLE w/ has_color_order: upper nibble = order
+    #   Byte 5: Value1 (brightness 0-100 for white mode, other uses for RGB)
+    #   Bytes 6-8: RGB (or brightness/speed in effect mode)
+    #   Byte 9: WW / Color Temp, Byte 10: LED Version (NOT brightness!), Byte 11: CW
+    (
+        power, mode_type, sub_mode, value1, r, g, b, ww, led_version, cw,
+    ) = _STATE_RESPONSE_FORMAT.unpack_from(data)
+
+    is_on = power == 0x23
     is_effect_mode = mode_type == 0x25
 
-    # Byte 4: Sub-mode
-    # In static mode: 0xF0/0x01/0x0B = RGB, 0x0F = white
-    # In effect mode: effect ID
-    # For SIMPLE devices with has_color_order: upper nibble contains color order
-    sub_mode = data[4]
-
     # Extract color order from upper nibble (for SIMPLE devices like 0x33)
     # Source: protocol_docs/17_color_order_settings.md
     # Values: 1=RGB, 2=GRB, 3=BRG
-    color_order_nibble = (data[4] & 0xF0) >> 4
+    color_order_nibble = (sub_mode & 0xF0) >> 4
 
     # Determine color mode from sub_mode (when in static mode)
     is_rgb_mode = False
     is_white_mode = False
     if mode_type == 0x61:  # Static mode
-        if sub_mode in (0xF0, 0x01, 0x0B):
-            is_rgb_mode = True
-        elif sub_mode == 0x0F:
-            is_white_mode = True
-
-    # Byte 5: Value1 (brightness 0-100 for white mode, other uses for RGB)
-    value1 = data[5]
-
-    # Bytes 6-8: RGB (or brightness/speed in effect mode)
-    r, g, b = data[6], data[7], data[8]
-
-    # Byte 9: WW / Color Temp, Byte 10: LED Version (NOT brightness!), Byte 11: CW
-    ww = data[9]
-    led_version = data[10]  # This is LED/firmware version, NOT brightness
-    cw = data[11]
+        sub_mode_kind = _SUB_MODE_KIND[sub_mode]
+        is_rgb_mode = sub_mode_kind == "rgb"
+        is_white_mode = sub_mode_kind == "cct"
 
     # Effect ID is sub_mode when in effect mode
     effect_id = sub_mode if is_effect_mode else None
 
-    return {
-        "is_on": is_on,
-        "mode_type": mode_type,
-        "sub_mode": sub_mode,
-        "value1": value1,
-        "r": r,
-        "g": g,
-        "b": b,
-        "ww": ww,
-        "cw": cw,
-        "led_version": led_version,  # NOT brightness - it's firmware version
-        "effect_id": effect_id,
-        "is_effect_mode": is_effect_mode,
-        "is_rgb_mode": is_rgb_mode,
-        "is_white_mode": is_white_mode,
-        "color_order_nibble": color_order_nibble,  # For SIMPLE devices with has_color_order
-    }
+    return StateResponse(
+        is_on=is_on,
+        mode_type=mode_type,
+        sub_mode=sub_mode,
+        value1=value1,
+        r=r,
+        g=g,
+        b=b,
+        ww=ww,
+        cw=cw,
+        led_version=led_version,  # NOT brightness - it's firmware version
+        effect_id=effect_id,
+        is_effect_mode=is_effect_mode,
+        is_rgb_mode=is_rgb_mode,
+        is_white_mode=is_white_mode,
+        color_order_nibble=color_order_nibble,  # For SIMPLE devices with has_color_order
+    )
 
 
 def parse_ring_led_settings_response(data: bytes) -> dict | None:
@@ -1608,9 +1668,9 @@ def parse_ring_led_settings_response(data: bytes) -> dict | None:
     if len(data) < 5 or data[0] != 0x63:
         return None
     return {
-        "led_count": data[2] & 0xFF,
-        "ic_type": data[3] & 0xFF,
-        "color_order": data[4] & 0xFF,
+        "led_count": data[2],
+        "ic_type": data[3],
+        "color_order": data[4],
         "segments": 1,
     }
 
@@ -1652,12 +1712,13 @@ def parse_led_settings_response(data: bytes) -> dict | None:
 
     # Log raw bytes for debugging format issues
     # Different devices may have different formats - see protocol_docs/16_query_formats_0x63_vs_0x44.md
-    raw_hex = ' '.join(f'0x{b:02X}' for b in data[:10])
-    _LOGGER.debug("LED settings raw bytes: %s", raw_hex)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        raw_hex = data[:10].hex(' ').upper()
+        _LOGGER.debug("LED settings raw bytes: %s", raw_hex)
 
     direction = data[1]
     # LED count: bytes 2-3 little-endian (LEDs per segment, not total)
-    led_count = data[2] | (data[3] << 8)
+    (led_count,) = _U16_LE.unpack_from(data, 2)
     # Segments: byte 4 only (single byte, NOT 16-bit!)
     # Total LEDs = led_count × segments
     segments = data[4]
@@ -1728,12 +1789,12 @@ def parse_led_settings_response_a3(data: bytes) -> dict | None:
     # Actually: Java does g2.c.a(new byte[]{bArr[3], bArr[2]}) for led count
     # which means bArr[3] is treated as first byte (high), bArr[2] as second (low)
     # But indices in Java start after response header, so adjust
-    led_count = (data[2] << 8) | data[3]
-    segments = (data[4] << 8) | data[5]
-    ic_type = data[6] & 0xFF
-    color_order = data[7] & 0xFF
-    music_led_count = data[8] & 0xFF if len(data) > 8 else 30
-    music_segments = data[9] & 0xFF if len(data) > 9 else 10
+    (led_count,) = _U16_BE.unpack_from(data, 2)
+    (segments,) = _U16_BE.unpack_from(data, 4)
+    ic_type = data[6]
+    color_order = data[7]
+    music_led_count = data[8] if len(data) > 8 else 30
+    music_segments = data[9] if len(data) > 9 else 10
 
     return {
         "has_rgbw": has_rgbw,
@@ -1784,6 +1845,346 @@ def product_id_from_name(device_name: str | None) -> int | None:
     return None
 
 
+# Base result for the IOTBT manufacturer-data formats. Each branch copies it and
+# fills in only the fields its format provides. IOTBT advertisements carry no
+# BLE/firmware version and no RGB/CCT state; product_id is always 0x00
+# (const.py defines IOTBT at product_id=0).
+_IOTBT_RESULT_TEMPLATE = {
+    "product_id": 0x00,
+    "power_state": None,
+    "format": None,
+    "manu_id": None,
+    "ble_version": None,
+    "fw_version": None,
+    "sta": None,
+    "color_mode": None,
+    "rgb": None,
+    "color_temp_percent": None,
+    "brightness_percent": None,
+    "effect_id": None,
+    "effect_speed": None,
+}
+
+# Format B manufacturer data (27 bytes, company ID is the dict key), identification
+# prefix: sta, ble_version, [mac x6], product_id (BE), firmware_ver, led_version
+_MANU_FORMAT_B_ID = struct.Struct(">BB6xHBB")
+
+# Format B state_data, bytes 14-24 (see _ManuStateBytes)
+_MANU_STATE_DATA = struct.Struct("11B")
+_MANU_STATE_DATA_OFFSET = 14
+
+# Telink BLE Mesh company ID, used by IOTBT devices (product_id=0x00/0x80)
+# Source: protocol_docs/17_device_configuration.md
+_TELINK_COMPANY_ID = 0x1102  # 4354
+
+# Valid LEDnetWF/ZengGe company IDs: 0x5A** (23040-23295)
+# Source: protocol_docs/03_manufacturer_data_parsing.md
+_LEDNET_COMPANY_ID_RANGE = range(0x5A00, 0x5B00)
+
+# IOTBT custom format under the Telink company ID: sta, power, mode, effect_id
+_MANU_TELINK_IOTBT = struct.Struct("4B")
+
+
+@lru_cache(maxsize=256)
+def _format_fw_version(firmware_ver: int, led_version: int) -> str:
+    """Format the firmware/LED version pair, cached as it never changes per device."""
+    return f"{firmware_ver:02X}.{led_version:02X}"
+
+
+@lru_cache(maxsize=256)
+def _make_log_prefix(device_name: str | None) -> str:
+    """Build the "[name] " debug log prefix, cached per device name."""
+    return f"[{device_name}] " if device_name else ""
+
+
+class _ManuStateBytes(NamedTuple):
+    """Format B state_data: manufacturer data bytes 14-24 (ble_version >= 5)."""
+
+    power: int      # Byte 14: 0x23 = on, 0x24 = off
+    mode_type: int  # Byte 15: 0x61 = color/white, 0x25 = effect
+    sub_mode: int   # Byte 16: 0xF0/0x01/0x0B = RGB, 0x0F = white, or effect ID
+    b17: int        # Brightness % (white mode)
+    b18: int        # Bytes 18-20: RGB or brightness+speed (effect mode)
+    b19: int
+    b20: int
+    b21: int        # Color temp % (white mode)
+    b22: int
+    b23: int
+    b24: int
+
+
+class _ManuState(NamedTuple):
+    """State decoded from Format B state_data by a _MANU_STATE_HANDLERS entry."""
+
+    color_mode: str | None = None
+    rgb: tuple[int, int, int] | None = None
+    color_temp_percent: int | None = None
+    brightness_percent: int | None = None
+    effect_id: int | None = None
+    effect_speed: int | None = None
+
+
+# No state: ble_version < 5 or an unrecognised mode
+_NO_MANU_STATE = _ManuState()
+
+
+# Format B state_data handlers, selected by _MANU_STATE_HANDLERS.
+# Source: model_0x53.py model_specific_manu_data()
+
+def _manu_state_rgb(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """RGB mode (0xF0=RGB, 0x01/0x0B may be effects/music mode but show as RGB)."""
+    rgb = (state.b18, state.b19, state.b20)
+    _LOGGER.debug("%sManu data RGB mode: rgb=%s", log_prefix, rgb)
+    return _ManuState('rgb', rgb=rgb)
+
+
+def _manu_state_cct(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """White/CCT mode: brightness % in byte 17, color temp % in byte 21."""
+    # b21: 0-100 (0=2700K, 100=6500K), b17: 0-100
+    _LOGGER.debug("%sManu data CCT mode: temp_pct=%d, bright_pct=%d",
+                  log_prefix, state.b21, state.b17)
+    return _ManuState('cct', color_temp_percent=state.b21, brightness_percent=state.b17)
+
+
+def _manu_state_standby(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Power ON state - device on but no specific color mode.
+
+    0x23 (35) = PowerType_PowerON per protocol docs
+    """
+    _LOGGER.debug("%sManu data standby mode (0x23 power on)", log_prefix)
+    return _ManuState('standby')
+
+
+def _manu_state_off(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Power OFF state. 0x24 (36) = PowerType_PowerOFF per protocol docs."""
+    _LOGGER.debug("%sManu data power off mode (0x24)", log_prefix)
+    return _ManuState('off')
+
+
+def _manu_state_settled(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Settled Mode effect (Symphony devices has_ic_config).
+
+    mode_type=0x61 with sub_mode=1-10 indicates Settled effect.
+    RGB is in bytes 18-20 (foreground color), speed is in byte 17.
+    """
+    rgb = (state.b18, state.b19, state.b20)
+    _LOGGER.debug(
+        "%sManu data Settled Mode effect: id=%d, rgb=%s, speed=%d",
+        log_prefix, state.sub_mode, rgb, state.b17
+    )
+    return _ManuState('settled', rgb=rgb, effect_id=state.sub_mode, effect_speed=state.b17)
+
+
+def _manu_state_unknown_sub_mode(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Static mode with an unrecognised sub-mode: log full state bytes."""
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "%sManu data unknown sub-mode: 0x%02X (mode_type=0x61), "
+            "state_bytes[14:24]: %s",
+            log_prefix, state.sub_mode, bytes(state).hex(' ').upper()
+        )
+    return _NO_MANU_STATE
+
+
+def _manu_state_effect(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Effect mode (0x25) - interpretation depends on device type.
+
+    For Symphony/Addressable: sub_mode is the effect ID directly.
+    For SIMPLE devices: sub_mode may be offset by 20 from actual effect ID (37-56).
+    """
+    sub_mode = state.sub_mode
+    # Effect ID in sub_mode byte; SIMPLE effects 37-56 arrive as sub_mode 17-36
+    effect_id = _EFFECT_ID_FROM_SUB_MODE[sub_mode]
+
+    if effect_id != sub_mode:
+        # Could be SIMPLE effect with 20 offset
+        _LOGGER.debug("%sManu data effect mode (0x25): sub_mode=%d, "
+                      "possible_simple_id=%d, bright_pct=%d, speed=%d",
+                      log_prefix, sub_mode, effect_id, state.b18, state.b19)
+    else:
+        _LOGGER.debug("%sManu data effect mode (0x25): id=%d, bright_pct=%d, speed=%d",
+                      log_prefix, effect_id, state.b18, state.b19)
+
+    # Byte 18 = brightness 0-100, byte 19 = speed 0-100
+    return _ManuState('effect', brightness_percent=state.b18, effect_id=effect_id,
+                      effect_speed=state.b19)
+
+
+def _manu_state_simple_effect(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """SIMPLE effect mode (0x61 command) - mode_type IS the effect ID (37-56).
+
+    For SIMPLE devices (0x33, etc.), when running effects like
+    "Yellow gradual change" (41), the mode_type contains the effect ID directly.
+    """
+    mode_type, sub_mode = state.mode_type, state.sub_mode
+    # sub_mode may contain speed or other param (0x23 observed)
+    # Bytes 17-20 interpretation for SIMPLE effects may differ
+    # For now, try to extract brightness from common positions
+    brightness_percent = state.b17 if state.b17 <= 100 else None
+    effect_speed = sub_mode if sub_mode <= 100 else None
+    _LOGGER.debug("%sManu data SIMPLE effect mode: id=%d (0x%02X), "
+                  "sub_mode=0x%02X, bright_pct=%s",
+                  log_prefix, mode_type, mode_type, sub_mode, brightness_percent)
+    return _ManuState('effect', brightness_percent=brightness_percent,
+                      effect_id=mode_type, effect_speed=effect_speed)
+
+
+def _manu_state_sound_reactive(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Sound reactive mode (built-in microphone).
+
+    0x5D (93) - SIMPLE devices with mic (e.g., product 0x08 Ctrl_Mini_RGB_Mic)
+    0x62 (98) - Symphony devices with mic
+    """
+    # Byte 17: SENSITIVITY - command uses 1-100, adv may use different scale
+    # Brightness is NOT available in sound reactive advertisement data
+    sensitivity_raw = state.b17
+    # Map sensitivity to effect_speed (0-100) for UI
+    # If value is 1-100, use directly; if 1-31 (IR remote scale), map to 0-100
+    if sensitivity_raw <= 0:
+        effect_speed = 50  # Default if invalid
+    elif sensitivity_raw <= 31:
+        # IR remote uses 1-31 scale, map to 1-100
+        effect_speed = max(1, int(sensitivity_raw * 100 / 31))
+    elif sensitivity_raw <= 100:
+        # App/BLE uses 1-100 scale directly
+        effect_speed = sensitivity_raw
+    else:
+        effect_speed = 100  # Cap at 100
+    # Bytes 18-20: real-time RGB color (changes with sound) - often 0,0,0 when idle
+    rgb = (state.b18, state.b19, state.b20)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        state_bytes = bytes(state).hex(' ').upper()
+        _LOGGER.debug("%sManu data sound reactive mode: mode_type=0x%02X, sensitivity_raw=%d, speed=%d%%, rgb=%s, state_bytes[14:24]: %s",
+                      log_prefix, state.mode_type, sensitivity_raw, effect_speed, rgb, state_bytes)
+    # Special effect ID 0x100 for Sound Reactive (same as IOTBT_MUSIC_EFFECTS)
+    return _ManuState('sound_reactive', rgb=rgb, effect_id=0x100, effect_speed=effect_speed)
+
+
+def _manu_state_unknown_mode(state: _ManuStateBytes, log_prefix: str) -> _ManuState:
+    """Unrecognised mode_type: log full state bytes."""
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "%sManu data unknown mode_type: 0x%02X, sub_mode: 0x%02X, "
+            "state_bytes[14:24]: %s",
+            log_prefix, state.mode_type, state.sub_mode, bytes(state).hex(' ').upper()
+        )
+    return _NO_MANU_STATE
+
+
+# (mode_type kind, sub_mode kind) -> handler. The sub_mode kind is only used
+# for static mode (0x61); other modes are keyed with None.
+_MANU_STATE_HANDLERS: dict[
+    tuple[str, str | None], Callable[[_ManuStateBytes, str], _ManuState]
+] = {
+    ("static", "rgb"): _manu_state_rgb,
+    ("static", "cct"): _manu_state_cct,
+    ("static", "standby"): _manu_state_standby,
+    ("static", "off"): _manu_state_off,
+    ("static", "settled"): _manu_state_settled,
+    ("effect", None): _manu_state_effect,
+    ("simple_effect", None): _manu_state_simple_effect,
+    ("sound_reactive", None): _manu_state_sound_reactive,
+}
+
+
+class _ManuFormat(NamedTuple):
+    """Manufacturer data entry chosen by _detect_manu_format and its format."""
+
+    kind: str  # "iotbt_name", "iotbt", "telink_mesh", "iotbt_5axx" or "format_b"
+    manu_id: int
+    data: bytes
+
+
+def _detect_manu_format(
+    manu_data: dict[int, bytes],
+    device_name: str | None,
+    log_prefix: str,
+) -> _ManuFormat | None:
+    """
+    Pick the manufacturer data entry to decode and detect its format.
+
+    Shared by parse_manufacturer_data and parse_manufacturer_data_brief so that
+    discovery always identifies a device the same way runtime parsing does.
+
+    Args:
+        manu_data: Manufacturer data dict from BLE advertisement
+        device_name: Optional device name (IOTBT* names force IOTBT format)
+        log_prefix: Prefix for debug log messages
+
+    Returns:
+        _ManuFormat, or None if no valid LEDnetWF manufacturer data was found
+    """
+    if not manu_data:
+        return None
+
+    # IOTBT name-based detection (highest priority)
+    # Device names starting with "IOTBT" are definitely IOTBT devices regardless of
+    # manufacturer data format. This handles cases where the advertisement data
+    # doesn't match expected IOTBT patterns (e.g., service data UUID 0x5A00 with
+    # non-standard format that causes product_id misdetection).
+    # Only the 5-char prefix is case-folded (advertised names are ASCII), so a
+    # long name doesn't cost a full upper-cased copy on every advertisement.
+    if device_name and device_name[:5].upper() == "IOTBT":
+        manu_id = next(iter(manu_data))
+        return _ManuFormat("iotbt_name", manu_id, manu_data[manu_id])
+
+    # Check for Telink BLE Mesh format (Company ID 4354)
+    if _TELINK_COMPANY_ID in manu_data:
+        data = manu_data[_TELINK_COMPANY_ID]
+        if len(data) >= 4:
+            # IOTBT devices use a CUSTOM format (NOT standard Telink BLE Mesh),
+            # detected by the power marker (0x23=ON, 0x24=OFF) in byte 1
+            if data[1] in (0x23, 0x24):
+                return _ManuFormat("iotbt", _TELINK_COMPANY_ID, data)
+            # Standard Telink BLE Mesh format (fallback)
+            if len(data) >= 11:
+                return _ManuFormat("telink_mesh", _TELINK_COMPANY_ID, data)
+        else:
+            _LOGGER.debug(
+                "%sTelink data too short: %d bytes (expected 4+)",
+                log_prefix, len(data)
+            )
+
+        # Telink is the only company ID, so there is no 0x5A** entry to scan
+        if len(manu_data) == 1:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%sNo valid LEDnetWF manufacturer data found in: %s",
+                              log_prefix, {hex(k): len(v) for k, v in manu_data.items()})
+            return None
+
+    # Find valid company ID in 0x5A** range (23040-23295)
+    # Filter company ID and the fixed 27-byte length in one comprehension rather
+    # than a loop-with-continue, since advertisements often carry other vendors'
+    # IDs alongside ours. Wrong-length entries are only reported when debugging.
+    candidates = [
+        (manu_id, data) for manu_id, data in manu_data.items()
+        if manu_id in _LEDNET_COMPANY_ID_RANGE and len(data) == 27
+    ]
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        for manu_id, data in manu_data.items():
+            if manu_id in _LEDNET_COMPANY_ID_RANGE and len(data) != 27:
+                _LOGGER.debug(
+                    "Manufacturer data wrong length: %d bytes (expected 27), company_id=0x%04X",
+                    len(data), manu_id
+                )
+
+    if candidates:
+        manu_id, data = candidates[0]
+        # IOTBT device advertising with 0x5Axx company ID: power marker
+        # (0x23/0x24) at byte 1 and product_id (bytes 8-9) = 0x00
+        # Source: old integration model_iotbt_0x80.py
+        if data[1] in (0x23, 0x24) and not data[8] and not data[9]:
+            return _ManuFormat("iotbt_5axx", manu_id, data)
+        return _ManuFormat("format_b", manu_id, data)
+
+    # No valid manufacturer data found
+    if debug_enabled:
+        _LOGGER.debug("%sNo valid LEDnetWF manufacturer data found in: %s",
+                      log_prefix, {hex(k): len(v) for k, v in manu_data.items()})
+    return None
+
+
 def parse_manufacturer_data(
     manu_data: dict[int, bytes],
     device_name: str | None = None
@@ -1816,26 +2217,25 @@ def parse_manufacturer_data(
         - fw_version: str
         - manu_id: int (company ID)
     """
-    # Log prefix for device identification
-    log_prefix = f"[{device_name}] " if device_name else ""
-    if not manu_data:
+    # Log prefix for device identification (only built when it will be logged)
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    log_prefix = _make_log_prefix(device_name) if debug_enabled else ""
+
+    detected = _detect_manu_format(manu_data, device_name, log_prefix)
+    if detected is None:
         return None
+    kind, manu_id, data = detected
 
-    # IOTBT name-based detection (highest priority)
-    # Device names starting with "IOTBT" are definitely IOTBT devices regardless of
-    # manufacturer data format. This handles cases where the advertisement data
-    # doesn't match expected IOTBT patterns (e.g., service data UUID 0x5A00 with
-    # non-standard format that causes product_id misdetection).
-    if device_name and device_name.upper().startswith("IOTBT"):
+    if kind == "iotbt_name":
         _LOGGER.debug(
             "%sIOTBT device detected by name prefix, forcing product_id=0x00",
             log_prefix
         )
         # Try to extract power state from manufacturer data if available
         power_state = None
-        for manu_id, data in manu_data.items():
-            if len(data) >= 2:
-                byte1 = data[1] & 0xFF
+        for entry in manu_data.values():
+            if len(entry) >= 2:
+                byte1 = entry[1]
                 if byte1 == 0x23:
                     power_state = True
                     break
@@ -1843,377 +2243,208 @@ def parse_manufacturer_data(
                     power_state = False
                     break
 
-        return {
-            "product_id": 0x00,  # IOTBT device
-            "power_state": power_state,
-            "format": "iotbt_name",  # Detected by device name prefix
-            "manu_id": list(manu_data.keys())[0] if manu_data else None,
-            "ble_version": None,
-            "fw_version": None,
-            "sta": None,
-            "color_mode": None,
-            "rgb": None,
-            "color_temp_percent": None,
-            "brightness_percent": None,
-            "effect_id": None,
-            "effect_speed": None,
-        }
-
-    # Check for Telink BLE Mesh format (Company ID 4354)
-    # Source: protocol_docs/17_device_configuration.md
-    # Used by IOTBT devices (product_id=0x00/0x80)
-    TELINK_COMPANY_ID = 4354  # 0x1102
-
-    if TELINK_COMPANY_ID in manu_data:
-        data = manu_data[TELINK_COMPANY_ID]
+        result = _IOTBT_RESULT_TEMPLATE.copy()
+        result["power_state"] = power_state
+        result["format"] = "iotbt_name"  # Detected by device name prefix
+        result["manu_id"] = manu_id
+        return result
 
-        # IOTBT devices use a CUSTOM format (NOT standard Telink BLE Mesh)
+    if kind == "iotbt":
+        # IOTBT custom format under the Telink company ID
         # Source: old integration model_iotbt_0x80.py _parse_state_from_manu_data()
         # Format (bleak - company ID is dict key, not in data):
         #   Byte 0: unknown (sta or mesh prefix)
         #   Byte 1: power state (0x23=ON, 0x24=OFF)
         #   Byte 2: mode (0x66=solid color, 0x67=effect, 0x69=music)
         #   Byte 3: effect_id (when in effect/music mode)
+        telink_sta, byte1, mode, effect_id = _MANU_TELINK_IOTBT.unpack_from(data)
+        power_on = (byte1 == 0x23)
+
+        # Determine color mode from mode byte
+        color_mode = None
+        if mode == 0x66:
+            color_mode = 'rgb'  # Solid color mode
+        elif mode == 0x67:
+            color_mode = 'effect'  # Regular effect mode
+        elif mode == 0x69:
+            color_mode = 'music'  # Music reactive mode
+            # For music mode, effect_id is shifted
+            if effect_id is not None:
+                effect_id = effect_id << 8
 
-        if len(data) >= 4:
-            # Detect IOTBT custom format by checking byte 1 for power markers
-            byte1 = data[1] & 0xFF
-            if byte1 in (0x23, 0x24):
-                # IOTBT custom format detected
-                power_on = (byte1 == 0x23)
-                mode = data[2] & 0xFF
-                effect_id = data[3] & 0xFF if len(data) > 3 else None
-
-                # Determine color mode from mode byte
-                color_mode = None
-                if mode == 0x66:
-                    color_mode = 'rgb'  # Solid color mode
-                elif mode == 0x67:
-                    color_mode = 'effect'  # Regular effect mode
-                elif mode == 0x69:
-                    color_mode = 'music'  # Music reactive mode
-                    # For music mode, effect_id is shifted
-                    if effect_id is not None:
-                        effect_id = effect_id << 8
+        _LOGGER.debug(
+            "%sParsed IOTBT manu data: power=%s, mode=0x%02X (%s), effect_id=%s",
+            log_prefix, "ON" if power_on else "OFF", mode,
+            color_mode or "unknown", effect_id
+        )
 
-                _LOGGER.debug(
-                    "%sParsed IOTBT manu data: power=%s, mode=0x%02X (%s), effect_id=%s",
-                    log_prefix, "ON" if power_on else "OFF", mode,
-                    color_mode or "unknown", effect_id
-                )
+        result = _IOTBT_RESULT_TEMPLATE.copy()
+        result["power_state"] = power_on
+        result["format"] = "iotbt"
+        result["manu_id"] = manu_id
+        result["sta"] = telink_sta
+        result["color_mode"] = color_mode
+        result["effect_id"] = effect_id
+        return result
 
-                return {
-                    "product_id": 0x00,  # IOTBT device - use 0x00 (const.py defines IOTBT at product_id=0)
-                    "power_state": power_on,
-                    "format": "iotbt",
-                    "manu_id": TELINK_COMPANY_ID,
-                    "ble_version": None,  # IOTBT doesn't use BLE version in advertisement
-                    "fw_version": None,   # Firmware version not in advertisement
-                    "sta": data[0] & 0xFF,
-                    "color_mode": color_mode,
-                    "rgb": None,  # IOTBT doesn't include RGB in advertisement
-                    "color_temp_percent": None,
-                    "brightness_percent": None,
-                    "effect_id": effect_id,
-                    "effect_speed": None,
-                }
-            else:
-                # Standard Telink BLE Mesh format (fallback)
-                # Raw offsets: mesh_uuid@2-3, product_uuid@8-9, status@10, mesh_addr@11-12
-                # Bleak offsets (subtract 2): mesh_uuid@0-1, product_uuid@6-7, status@8
-                if len(data) >= 11:
-                    status = data[8] & 0xFF
-                    power_on = status > 0
-                    mesh_address = (data[10] << 8) | data[9]
-
-                    _LOGGER.debug(
-                        "%sParsed Telink mesh manu data: status=%d, power=%s, mesh_addr=0x%04X",
-                        log_prefix, status, "ON" if power_on else "OFF", mesh_address
-                    )
-
-                    return {
-                        "product_id": 0x00,  # IOTBT device - use 0x00 (const.py defines IOTBT at product_id=0)
-                        "power_state": power_on,
-                        "format": "telink_mesh",
-                        "manu_id": TELINK_COMPANY_ID,
-                        "mesh_address": mesh_address,
-                        "status": status,
-                        "ble_version": None,
-                        "fw_version": None,
-                        "sta": None,
-                        "color_mode": None,
-                        "rgb": None,
-                        "color_temp_percent": None,
-                        "brightness_percent": None,
-                        "effect_id": None,
-                        "effect_speed": None,
-                    }
-        else:
-            _LOGGER.debug(
-                "%sTelink data too short: %d bytes (expected 4+)",
-                log_prefix, len(data)
-            )
+    if kind == "telink_mesh":
+        # Standard Telink BLE Mesh format
+        # Raw offsets: mesh_uuid@2-3, product_uuid@8-9, status@10, mesh_addr@11-12
+        # Bleak offsets (subtract 2): mesh_uuid@0-1, product_uuid@6-7, status@8
+        status = data[8]
+        power_on = status > 0
+        (mesh_address,) = _U16_LE.unpack_from(data, 9)
 
-    # Find valid company ID in 0x5A** range (23040-23295)
-    # Source: protocol_docs/03_manufacturer_data_parsing.md
-    VALID_COMPANY_ID_MIN = 23040  # 0x5A00
-    VALID_COMPANY_ID_MAX = 23295  # 0x5AFF
+        _LOGGER.debug(
+            "%sParsed Telink mesh manu data: status=%d, power=%s, mesh_addr=0x%04X",
+            log_prefix, status, "ON" if power_on else "OFF", mesh_address
+        )
 
-    for manu_id, data in manu_data.items():
-        if not (VALID_COMPANY_ID_MIN <= manu_id <= VALID_COMPANY_ID_MAX):
-            continue
+        result = _IOTBT_RESULT_TEMPLATE.copy()
+        result["power_state"] = power_on
+        result["format"] = "telink_mesh"
+        result["manu_id"] = manu_id
+        result["mesh_address"] = mesh_address
+        result["status"] = status
+        return result
 
-        if len(data) != 27:
-            _LOGGER.debug(
-                "Manufacturer data wrong length: %d bytes (expected 27), company_id=0x%04X",
-                len(data), manu_id
-            )
-            continue
+    # Parse Format B identification fields (standard ZengGe format)
+    # Product ID is bytes 8-9 (big-endian)
+    sta, ble_version, product_id, firmware_ver, led_version = (
+        _MANU_FORMAT_B_ID.unpack_from(data)
+    )
 
-        # Check for IOTBT device advertising with 0x5Axx company ID
-        # Source: old integration model_iotbt_0x80.py
-        # IOTBT format has power marker (0x23/0x24) at byte 1 and product_id=0x00
-        byte1 = data[1] & 0xFF
-        bytes8_9_product = (data[8] << 8) | data[9]
-
-        if bytes8_9_product == 0x00 and byte1 in (0x23, 0x24):
-            # IOTBT device using 0x5Axx company ID with IOTBT data format
-            # Byte 1 = power state (0x23=ON, 0x24=OFF)
-            # Byte 2 = mode (0x66=solid, 0x67=effect, 0x69=music)
-            # Byte 3 = effect_id
-            power_on = (byte1 == 0x23)
-            mode = data[2] & 0xFF if len(data) > 2 else 0
-            iotbt_effect_id = data[3] & 0xFF if len(data) > 3 else None
-
-            color_mode = None
-            if mode == 0x66:
-                color_mode = 'rgb'
-            elif mode == 0x67:
-                color_mode = 'effect'
-            elif mode == 0x69:
-                color_mode = 'music'
-                if iotbt_effect_id is not None:
-                    iotbt_effect_id = iotbt_effect_id << 8
+    if kind == "iotbt_5axx":
+        # IOTBT device using 0x5Axx company ID with IOTBT data format
+        # Byte 1 = power state (0x23=ON, 0x24=OFF)
+        # Byte 2 = mode (0x66=solid, 0x67=effect, 0x69=music)
+        # Byte 3 = effect_id
+        power_on = (ble_version == 0x23)
+        mode = data[2]
+        iotbt_effect_id = data[3]
+
+        color_mode = None
+        if mode == 0x66:
+            color_mode = 'rgb'
+        elif mode == 0x67:
+            color_mode = 'effect'
+        elif mode == 0x69:
+            color_mode = 'music'
+            if iotbt_effect_id is not None:
+                iotbt_effect_id = iotbt_effect_id << 8
 
-            _LOGGER.debug(
-                "%sDetected IOTBT device (0x5Axx company ID): power=%s, mode=0x%02X (%s), effect=%s",
-                log_prefix, "ON" if power_on else "OFF", mode, color_mode or "unknown", iotbt_effect_id
-            )
+        _LOGGER.debug(
+            "%sDetected IOTBT device (0x5Axx company ID): power=%s, mode=0x%02X (%s), effect=%s",
+            log_prefix, "ON" if power_on else "OFF", mode, color_mode or "unknown", iotbt_effect_id
+        )
 
-            return {
-                "product_id": 0x00,  # IOTBT device
-                "power_state": power_on,
-                "format": "iotbt_5axx",  # IOTBT format with 0x5Axx company ID
-                "manu_id": manu_id,
-                "ble_version": None,  # IOTBT doesn't use standard BLE version
-                "fw_version": None,   # Firmware version not in advertisement
-                "sta": data[0] & 0xFF,
-                "color_mode": color_mode,
-                "rgb": None,
-                "color_temp_percent": None,
-                "brightness_percent": None,
-                "effect_id": iotbt_effect_id,
-                "effect_speed": None,
-            }
-
-        # Parse Format B fields (standard ZengGe format)
-        sta = data[0]
-        ble_version = data[1]
-
-        # Product ID is bytes 8-9 (big-endian)
-        product_id = (data[8] << 8) | data[9]
-
-        # Firmware version from byte 10
-        firmware_ver = data[10]
-        led_version = data[11]
-        fw_version = f"{firmware_ver:02X}.{led_version:02X}"
-
-        # Power state is byte 14 of state_data (0x23 = on, 0x24 = off)
-        # Only available if ble_version >= 5
+        result = _IOTBT_RESULT_TEMPLATE.copy()
+        result["power_state"] = power_on
+        result["format"] = "iotbt_5axx"  # IOTBT format with 0x5Axx company ID
+        result["manu_id"] = manu_id
+        result["sta"] = sta
+        result["color_mode"] = color_mode
+        result["effect_id"] = iotbt_effect_id
+        return result
+
+    # Firmware version from byte 10, LED version from byte 11
+    fw_version = _format_fw_version(firmware_ver, led_version)
+
+    # state_data (bytes 14-24) is only present if ble_version >= 5.
+    # Power state is byte 14 (0x23 = on, 0x24 = off); the rest is decoded by
+    # the handler for its (mode kind, sub-mode kind), see _MANU_STATE_HANDLERS.
+    if ble_version >= 5:
+        state_bytes = _ManuStateBytes._make(
+            _MANU_STATE_DATA.unpack_from(data, _MANU_STATE_DATA_OFFSET)
+        )
+        power_state = _POWER_MAP.get(state_bytes.power)
+        mode_kind = _MODE_TYPE_KIND[state_bytes.mode_type]
+        sub_mode_kind = (
+            _SUB_MODE_KIND[state_bytes.sub_mode] if mode_kind == "static" else None
+        )
+        handler = _MANU_STATE_HANDLERS.get((mode_kind, sub_mode_kind)) or (
+            _manu_state_unknown_sub_mode if mode_kind == "static"
+            else _manu_state_unknown_mode
+        )
+        state = handler(state_bytes, log_prefix)
+    else:
         power_state = None
-        if ble_version >= 5 and len(data) > 14:
-            if data[14] == 0x23:
-                power_state = True
-            elif data[14] == 0x24:
-                power_state = False
-
-        # Parse state_data (bytes 14-24) for color/mode/brightness
-        # Source: model_0x53.py model_specific_manu_data()
-        # Byte 15 = mode type (0x61=color/white, 0x25=effect)
-        # Byte 16 = sub-mode (0xF0/0x01/0x0B=RGB, 0x0F=white) or effect ID
-        # Byte 17 = brightness % (white mode)
-        # Bytes 18-20 = RGB or brightness+speed (effect mode)
-        # Byte 21 = color temp % (white mode)
-        color_mode = None  # 'rgb', 'cct', 'effect'
-        rgb = None
-        color_temp_percent = None
-        brightness_percent = None
-        effect_id = None
-        effect_speed = None
-
-        if ble_version >= 5 and len(data) >= 22:
-            mode_type = data[15]  # 0x61=color/white, 0x25=effect
-            sub_mode = data[16]
-
-            if mode_type == 0x61:
-                # Color or white mode
-                if sub_mode in (0xF0, 0x01, 0x0B):
-                    # RGB mode (0xF0=RGB, 0x01/0x0B may be effects/music mode but show as RGB)
-                    color_mode = 'rgb'
-                    rgb = (data[18], data[19], data[20])
-                    _LOGGER.debug("%sManu data RGB mode: rgb=%s", log_prefix, rgb)
-                elif sub_mode == 0x0F:
-                    # White/CCT mode
-                    color_mode = 'cct'
-                    brightness_percent = data[17]  # 0-100
-                    color_temp_percent = data[21]  # 0-100 (0=2700K, 100=6500K)
-                    _LOGGER.debug("%sManu data CCT mode: temp_pct=%d, bright_pct=%d",
-                                  log_prefix, color_temp_percent, brightness_percent)
-                elif sub_mode == 0x23:
-                    # Power ON state - device on but no specific color mode
-                    # 0x23 (35) = PowerType_PowerON per protocol docs
-                    color_mode = 'standby'
-                    _LOGGER.debug("%sManu data standby mode (0x23 power on)", log_prefix)
-                elif sub_mode == 0x24:
-                    # Power OFF state
-                    # 0x24 (36) = PowerType_PowerOFF per protocol docs
-                    color_mode = 'off'
-                    _LOGGER.debug("%sManu data power off mode (0x24)", log_prefix)
-                elif 1 <= sub_mode <= 10:
-                    # Settled Mode effect (Symphony devices has_ic_config)
-                    # mode_type=0x61 with sub_mode=1-10 indicates Settled effect
-                    # RGB is in bytes 18-20 (foreground color)
-                    # Speed is in byte 17
-                    color_mode = 'settled'
-                    effect_id = sub_mode  # Settled effect 1-10
-                    rgb = (data[18], data[19], data[20])
-                    effect_speed = data[17]  # Speed for settled effects
-                    _LOGGER.debug(
-                        "%sManu data Settled Mode effect: id=%d, rgb=%s, speed=%d",
-                        log_prefix, effect_id, rgb, effect_speed
-                    )
-                else:
-                    # Log full state bytes for debugging unknown sub-modes
-                    state_bytes = ' '.join(f'{b:02X}' for b in data[14:min(25, len(data))])
-                    _LOGGER.debug(
-                        "%sManu data unknown sub-mode: 0x%02X (mode_type=0x61), "
-                        "state_bytes[14:24]: %s",
-                        log_prefix, sub_mode, state_bytes
-                    )
-            elif mode_type == 0x25:
-                # Effect mode - interpretation depends on device type
-                # For Symphony/Addressable: sub_mode is the effect ID directly
-                # For SIMPLE devices: sub_mode may be offset by 20 from actual effect ID (37-56)
-                color_mode = 'effect'
-                effect_id = sub_mode  # Effect ID in sub_mode byte
-
-                # Check if this might be a SIMPLE effect (offset by 20)
-                # SIMPLE effects are 37-56, so sub_mode 17-36 → effect_id 37-56
-                if 17 <= sub_mode <= 36:
-                    # Could be SIMPLE effect with 20 offset
-                    possible_simple_id = sub_mode + 20
-                    _LOGGER.debug("%sManu data effect mode (0x25): sub_mode=%d, "
-                                  "possible_simple_id=%d, bright_pct=%d, speed=%d",
-                                  log_prefix, sub_mode, possible_simple_id, data[18], data[19])
-                    effect_id = possible_simple_id
-                else:
-                    _LOGGER.debug("%sManu data effect mode (0x25): id=%d, bright_pct=%d, speed=%d",
-                                  log_prefix, effect_id, data[18], data[19])
-
-                brightness_percent = data[18]  # 0-100
-                effect_speed = data[19]  # 0-100
-            elif 37 <= mode_type <= 56:
-                # SIMPLE effect mode (0x61 command) - mode_type IS the effect ID (37-56)
-                # For SIMPLE devices (0x33, etc.), when running effects like
-                # "Yellow gradual change" (41), the mode_type contains the effect ID directly
-                color_mode = 'effect'
-                effect_id = mode_type  # Effect ID is in mode_type, not sub_mode
-                # sub_mode may contain speed or other param (0x23 observed)
-                # Bytes 17-20 interpretation for SIMPLE effects may differ
-                # For now, try to extract brightness from common positions
-                brightness_percent = data[17] if data[17] <= 100 else None
-                effect_speed = sub_mode if sub_mode <= 100 else None
-                _LOGGER.debug("%sManu data SIMPLE effect mode: id=%d (0x%02X), "
-                              "sub_mode=0x%02X, bright_pct=%s",
-                              log_prefix, effect_id, mode_type, sub_mode, brightness_percent)
-            elif mode_type in (0x5D, 0x62):
-                # Sound reactive mode (built-in microphone)
-                # 0x5D (93) - SIMPLE devices with mic (e.g., product 0x08 Ctrl_Mini_RGB_Mic)
-                # 0x62 (98) - Symphony devices with mic
-                color_mode = 'sound_reactive'
-                effect_id = 0x100  # Special ID for Sound Reactive (same as IOTBT_MUSIC_EFFECTS)
-                # Byte 17: SENSITIVITY - command uses 1-100, adv may use different scale
-                # Brightness is NOT available in sound reactive advertisement data
-                sensitivity_raw = data[17] if len(data) > 17 else 0
-                # Map sensitivity to effect_speed (0-100) for UI
-                # If value is 1-100, use directly; if 1-31 (IR remote scale), map to 0-100
-                if sensitivity_raw <= 0:
-                    effect_speed = 50  # Default if invalid
-                elif sensitivity_raw <= 31:
-                    # IR remote uses 1-31 scale, map to 1-100
-                    effect_speed = max(1, int(sensitivity_raw * 100 / 31))
-                elif sensitivity_raw <= 100:
-                    # App/BLE uses 1-100 scale directly
-                    effect_speed = sensitivity_raw
-                else:
-                    effect_speed = 100  # Cap at 100
-                # Bytes 18-20: real-time RGB color (changes with sound) - often 0,0,0 when idle
-                if len(data) > 20:
-                    rgb = (data[18], data[19], data[20])
-                state_bytes = ' '.join(f'{b:02X}' for b in data[14:min(25, len(data))])
-                _LOGGER.debug("%sManu data sound reactive mode: mode_type=0x%02X, sensitivity_raw=%d, speed=%d%%, rgb=%s, state_bytes[14:24]: %s",
-                              log_prefix, mode_type, sensitivity_raw, effect_speed, rgb, state_bytes)
-            else:
-                # Log full state bytes for debugging unknown modes
-                state_bytes = ' '.join(f'{b:02X}' for b in data[14:min(25, len(data))])
-                _LOGGER.debug(
-                    "%sManu data unknown mode_type: 0x%02X, sub_mode: 0x%02X, "
-                    "state_bytes[14:24]: %s",
-                    log_prefix, mode_type, sub_mode, state_bytes
-                )
+        state = _NO_MANU_STATE
+
+    result = {
+        "product_id": product_id,
+        "power_state": power_state,
+        "ble_version": ble_version,
+        "fw_version": fw_version,
+        "manu_id": manu_id,
+        "sta": sta,
+        # State fields from bytes 15-21
+        "color_mode": state.color_mode,
+        "rgb": state.rgb,
+        "color_temp_percent": state.color_temp_percent,
+        "brightness_percent": state.brightness_percent,
+        "effect_id": state.effect_id,
+        "effect_speed": state.effect_speed,
+    }
 
-        result = {
-            "product_id": product_id,
-            "power_state": power_state,
-            "ble_version": ble_version,
-            "fw_version": fw_version,
-            "manu_id": manu_id,
-            "sta": sta,
-            # State fields from bytes 15-21
-            "color_mode": color_mode,
-            "rgb": rgb,
-            "color_temp_percent": color_temp_percent,
-            "brightness_percent": brightness_percent,
-            "effect_id": effect_id,
-            "effect_speed": effect_speed,
-        }
-
-        # Log comprehensive summary of parsed manufacturer data
+    # Log comprehensive summary of parsed manufacturer data
+    if debug_enabled:
         _LOGGER.debug(
             "%sParsed manu data: product_id=0x%02X (%d), ble_version=%d, "
             "fw=%s, power=%s, mode=%s",
             log_prefix, product_id, product_id, ble_version, fw_version,
             "ON" if power_state else ("OFF" if power_state is False else "unknown"),
-            color_mode or "unknown",
+            state.color_mode or "unknown",
         )
+        color_mode = state.color_mode
         if color_mode == "rgb":
-            _LOGGER.debug("%s  RGB state: rgb=%s", log_prefix, rgb)
+            _LOGGER.debug("%s  RGB state: rgb=%s", log_prefix, state.rgb)
         elif color_mode == "cct":
             _LOGGER.debug("%s  CCT state: temp_pct=%s%%, bright_pct=%s%%",
-                          log_prefix, color_temp_percent, brightness_percent)
+                          log_prefix, state.color_temp_percent, state.brightness_percent)
         elif color_mode == "effect":
             _LOGGER.debug("%s  Effect state: id=%s, speed=%s, bright_pct=%s%%",
-                          log_prefix, effect_id, effect_speed, brightness_percent)
+                          log_prefix, state.effect_id, state.effect_speed,
+                          state.brightness_percent)
         elif color_mode == "sound_reactive":
             _LOGGER.debug("%s  Sound reactive state: sensitivity/speed=%s%%, rgb=%s",
-                          log_prefix, effect_speed, rgb)
+                          log_prefix, state.effect_speed, state.rgb)
 
-        return result
+    return result
 
-    # No valid manufacturer data found
-    _LOGGER.debug("%sNo valid LEDnetWF manufacturer data found in: %s",
-                  log_prefix, {hex(k): len(v) for k, v in manu_data.items()})
-    return None
+
+def parse_manufacturer_data_brief(
+    manu_data: dict[int, bytes],
+    device_name: str | None = None
+) -> tuple[int, str | None] | None:
+    """
+    Identify a device from manufacturer data without parsing its state.
+
+    Uses the same format detection as parse_manufacturer_data (see
+    _detect_manu_format) but only reads the identification bytes, for discovery
+    where nothing else is used.
+
+    Args:
+        manu_data: Manufacturer data dict from BLE advertisement
+        device_name: Optional device name (IOTBT* names force product_id 0x00)
+
+    Returns:
+        (product_id, fw_version) matching parse_manufacturer_data, or None if
+        the full parser would find no valid data
+    """
+    log_prefix = (
+        _make_log_prefix(device_name) if _LOGGER.isEnabledFor(logging.DEBUG) else ""
+    )
+    detected = _detect_manu_format(manu_data, device_name, log_prefix)
+    if detected is None:
+        return None
+    # IOTBT and Telink formats carry no product ID or firmware version
+    if detected.kind != "format_b":
+        return 0x00, None
+    _sta, _ble_version, product_id, firmware_ver, led_version = (
+        _MANU_FORMAT_B_ID.unpack_from(detected.data)
+    )
+    return product_id, _format_fw_version(firmware_ver, led_version)
 
 
 # =============================================================================
@@ -2224,171 +2455,215 @@ def parse_manufacturer_data(
 SERVICE_UUID_FFFF = "0000ffff-0000-1000-8000-00805f9b34fb"
 SERVICE_UUID_SHORT = 0xFFFF
 
+# ZengGe manufacturer-specific service UUIDs (IOTBT and variants)
+_SERVICE_UUID_5A00 = "00005a00-0000-1000-8000-00805f9b34fb"
+_SERVICE_UUID_5B00 = "00005b00-0000-1000-8000-00805f9b34fb"
 
-def parse_service_data(service_data: bytes) -> dict | None:
-    """
-    Parse LEDnetWF service data (16 or 29 bytes).
+# Service UUIDs tried in order by get_service_data_from_advertisement
+_SERVICE_DATA_UUIDS = (SERVICE_UUID_FFFF, _SERVICE_UUID_5A00, _SERVICE_UUID_5B00)
 
-    Source: protocol_docs/17_device_configuration.md - Service Data Format
+# Fallback-scan verdicts per service data key ("ffff" in key, any case), so
+# repeat advertisements skip the lowercasing. Bounded, oldest evicted first.
+_FFFF_KEY_CACHE: dict[str, bool] = {}
+_FFFF_KEY_CACHE_MAX = 64
 
-    Service data provides device identification and version information.
-    For BLE v5+ devices, service data contains firmware version, LED version,
-    and other device-specific information.
+# IOTBT 14-byte service data: sta, ble_version, MAC, mesh_addr (big-endian),
+# led_version, mode, flags, flags2
+_SERVICE_DATA_IOTBT = struct.Struct(">BB6sHBBBB")
 
-    Args:
-        service_data: Raw service data bytes (16 or 29 bytes)
+# Standard 16-byte service data: sta, manufacturer (big-endian), ble_version,
+# MAC, product_id (big-endian), firmware_ver_lo, led_version, byte14, byte15
+_SERVICE_DATA_STANDARD = struct.Struct(">BHB6sHBBBB")
 
-    Returns:
-        Dict with device identification and version info, or None if invalid
 
-    Format (16-byte minimum):
-        Byte 0: sta - Status byte (255 = OTA mode)
-        Byte 1: mfr_hi - Manufacturer prefix (0x5A or 0x5B)
-        Byte 2: mfr_lo - Manufacturer low byte
-        Byte 3: ble_version - BLE protocol version
-        Byte 4-9: mac_address - Device MAC (6 bytes)
-        Byte 10-11: product_id - Product ID (big-endian)
-        Byte 12: firmware_ver_lo - Firmware version low byte
-        Byte 13: led_version - LED/hardware version
-        Byte 14: check_key + fw_hi - Bits 0-1: check_key, Bits 2-7: firmware high (BLE v6+)
-        Byte 15: firmware_flag - Feature flags (bits 0-4)
+class ServiceData(NamedTuple):
+    """Parsed service data (see parse_service_data).
+
+    Format-specific fields default to None: manufacturer/check_key_flag are
+    only set by the 16-byte format, mesh_address/mode/flags2 only by the IOTBT
+    14-byte format, and power_on/state_data/mode_type/sub_mode only by the
+    29-byte and BLE v7+ parsers.
+    """
+
+    sta: int
+    is_ota_mode: bool
+    ble_version: int
+    mac_address: str
+    product_id: int
+    firmware_ver: int
+    firmware_ver_str: str
+    led_version: int
+    firmware_flag: int
+    manufacturer: int | None = None
+    check_key_flag: int | None = None
+    is_iotbt: bool = False
+    mesh_address: int | None = None
+    mode: int | None = None
+    flags2: int | None = None
+    power_on: bool | None = None
+    state_data: bytes | None = None
+    mode_type: int | None = None
+    sub_mode: int | None = None
+
+
+@lru_cache(maxsize=256)
+def _parse_service_data(service_data: bytes) -> ServiceData | None:
+    """Parse service data; see parse_service_data. Results are cached by payload.
+
+    Does not log, as it only runs for the first advertisement of each payload;
+    parse_service_data logs every call via _log_service_data.
     """
     # Handle IOTBT 14-byte format (Telink BLE Mesh)
     # Format: [status][ble_ver][MAC 6 bytes][mesh_addr 2 bytes][led_ver][mode][flags][flags2]
     # Status byte can be 0x80 (standard) or 0x56 (variant seen on some IOTBT devices)
     # or other values. The 14-byte length with UUID 0x5A00 is the distinctive marker.
     if len(service_data) == 14:
-        sta = service_data[0] & 0xFF
-        ble_version = service_data[1] & 0xFF
-        mac_bytes = service_data[2:8]
-        mesh_addr = (service_data[8] << 8) | service_data[9]
-        led_version = service_data[10] & 0xFF
-        mode = service_data[11] & 0xFF
-        flags = service_data[12] & 0xFF
-        flags2 = service_data[13] & 0xFF
-
-        mac_address = ":".join(f"{b:02X}" for b in mac_bytes)
-
-        _LOGGER.debug(
-            "Parsed IOTBT service data (14-byte format): sta=0x%02X, ble_v=%d, mac=%s, "
-            "mesh_addr=0x%04X, led_ver=%d, mode=0x%02X, flags=0x%02X",
-            sta, ble_version, mac_address, mesh_addr, led_version, mode, flags
+        (
+            sta, ble_version, mac_bytes, mesh_addr, led_version, mode, flags, flags2,
+        ) = _SERVICE_DATA_IOTBT.unpack_from(service_data)
+
+        mac_address = mac_bytes.hex(":").upper()
+
+        return ServiceData(
+            sta=sta,
+            is_ota_mode=False,
+            is_iotbt=True,
+            ble_version=ble_version,
+            mac_address=mac_address,
+            mesh_address=mesh_addr,
+            led_version=led_version,
+            mode=mode,
+            flags2=flags2,
+            firmware_ver=led_version,  # Use led_version as firmware indicator
+            firmware_ver_str=str(led_version),
+            firmware_flag=flags,
+            product_id=0,  # IOTBT always product_id=0
         )
 
-        return {
-            "sta": sta,
-            "is_ota_mode": False,
-            "is_iotbt": True,
-            "ble_version": ble_version,
-            "mac_address": mac_address,
-            "mesh_address": mesh_addr,
-            "led_version": led_version,
-            "mode": mode,
-            "flags2": flags2,
-            "firmware_ver": led_version,  # Use led_version as firmware indicator
-            "firmware_ver_str": str(led_version),
-            "firmware_flag": flags,
-            "product_id": 0,  # IOTBT always product_id=0
-        }
-
     if len(service_data) < 16:
-        _LOGGER.debug("Service data too short: %d bytes (need 16)", len(service_data))
         return None
 
+    (
+        sta, manufacturer, ble_version, mac_bytes, product_id,
+        firmware_ver_lo, led_version, byte14, byte15,
+    ) = _SERVICE_DATA_STANDARD.unpack_from(service_data)
+
     # Check manufacturer prefix (0x5A or 0x5B) for standard ZengGe format
-    mfr_hi = service_data[1] & 0xFF
+    mfr_hi = manufacturer >> 8
     if mfr_hi not in (0x5A, 0x5B):
-        _LOGGER.debug("Service data invalid manufacturer prefix: 0x%02X", mfr_hi)
         return None
 
-    sta = service_data[0] & 0xFF
-    manufacturer = (mfr_hi << 8) | (service_data[2] & 0xFF)
-    ble_version = service_data[3] & 0xFF
-    mac_bytes = service_data[4:10]
-    product_id = (service_data[10] << 8) | service_data[11]
-    firmware_ver_lo = service_data[12] & 0xFF
-    led_version = service_data[13] & 0xFF
-
     # Extended firmware version for BLE v6+
     firmware_ver = firmware_ver_lo
     check_key_flag = 0
     firmware_flag = 0
 
-    if ble_version >= 6 and len(service_data) >= 16:
-        byte14 = service_data[14] & 0xFF
-        byte15 = service_data[15] & 0xFF
+    if ble_version >= 6:
         check_key_flag = byte14 & 0x03        # bits 0-1
         firmware_ver_hi = (byte14 >> 2) & 0x3F  # bits 2-7
         firmware_ver = firmware_ver_lo | (firmware_ver_hi << 8)
         firmware_flag = byte15 & 0x1F         # bits 0-4
 
     # Format MAC address for display
-    mac_address = ":".join(f"{b:02X}" for b in mac_bytes)
+    mac_address = mac_bytes.hex(":").upper()
 
     # Format firmware version string
     fw_version_str = f"{firmware_ver}"
     if ble_version >= 6 and firmware_ver > 255:
         fw_version_str = f"{firmware_ver >> 8}.{firmware_ver & 0xFF}"
 
+    # 29-byte service data also carries power state in byte 16
+    power_on = None
+    if len(service_data) >= 29:
+        power_on = _POWER_MAP.get(service_data[16])
+
+    return ServiceData(
+        sta=sta,
+        is_ota_mode=sta == 0xFF,
+        manufacturer=manufacturer,
+        ble_version=ble_version,
+        mac_address=mac_address,
+        product_id=product_id,
+        firmware_ver=firmware_ver,
+        firmware_ver_str=fw_version_str,
+        led_version=led_version,
+        check_key_flag=check_key_flag,
+        firmware_flag=firmware_flag,
+        power_on=power_on,
+    )
+
+
+def _log_service_data(service_data: bytes, result: ServiceData | None) -> None:
+    """Debug-log the outcome of parsing service data (see _parse_service_data)."""
+    if result is None:
+        if len(service_data) < 16:
+            _LOGGER.debug("Service data too short: %d bytes (need 16)", len(service_data))
+        else:
+            _LOGGER.debug("Service data invalid manufacturer prefix: 0x%02X",
+                          service_data[1])
+        return
+
+    if result.is_iotbt:
+        _LOGGER.debug(
+            "Parsed IOTBT service data (14-byte format): sta=0x%02X, ble_v=%d, mac=%s, "
+            "mesh_addr=0x%04X, led_ver=%d, mode=0x%02X, flags=0x%02X",
+            result.sta, result.ble_version, result.mac_address, result.mesh_address,
+            result.led_version, result.mode, result.firmware_flag
+        )
+        return
+
     _LOGGER.debug(
         "Parsed service data: sta=%d, mfr=0x%04X, ble_v=%d, mac=%s, "
         "product_id=0x%02X (%d), fw=%s, led_ver=%d",
-        sta, manufacturer, ble_version, mac_address,
-        product_id, product_id, fw_version_str, led_version
+        result.sta, result.manufacturer, result.ble_version, result.mac_address,
+        result.product_id, result.product_id, result.firmware_ver_str, result.led_version
     )
-
-    return {
-        "sta": sta,
-        "is_ota_mode": sta == 0xFF,
-        "manufacturer": manufacturer,
-        "ble_version": ble_version,
-        "mac_address": mac_address,
-        "product_id": product_id,
-        "firmware_ver": firmware_ver,
-        "firmware_ver_str": fw_version_str,
-        "led_version": led_version,
-        "check_key_flag": check_key_flag,
-        "firmware_flag": firmware_flag,
-    }
+    if len(service_data) >= 29:
+        power_on = result.power_on
+        _LOGGER.debug(
+            "Service data (29-byte): power=%s (byte16=0x%02X)",
+            "ON" if power_on else "OFF" if power_on is False else "unknown",
+            service_data[16]
+        )
 
 
-def parse_service_data_with_state(service_data: bytes) -> dict | None:
+def parse_service_data(service_data: bytes) -> ServiceData | None:
     """
-    Parse 29-byte service data that includes power state.
+    Parse LEDnetWF service data (16 or 29 bytes).
 
-    Source: protocol_docs/17_device_configuration.md - 29-byte Service Data
+    Source: protocol_docs/17_device_configuration.md - Service Data Format
 
-    When service data is 29 bytes, byte 16 contains power state:
-        Byte 16: power - 0x23 = ON, 0x24 = OFF
+    Service data provides device identification and version information.
+    For BLE v5+ devices, service data contains firmware version, LED version,
+    and other device-specific information.
 
     Args:
-        service_data: Raw service data (29 bytes)
+        service_data: Raw service data bytes (16 or 29 bytes)
 
     Returns:
-        Dict with device info and power state, or None if invalid
-    """
-    if len(service_data) < 29:
-        return parse_service_data(service_data)
-
-    result = parse_service_data(service_data)
-    if result is None:
-        return None
-
-    # Extract power state from byte 16
-    power_byte = service_data[16] & 0xFF
-    if power_byte == 0x23:
-        result["power_on"] = True
-    elif power_byte == 0x24:
-        result["power_on"] = False
-    else:
-        result["power_on"] = None
+        ServiceData with device identification and version info, or None if invalid
 
-    _LOGGER.debug(
-        "Service data (29-byte): power=%s (byte16=0x%02X)",
-        "ON" if result.get("power_on") else "OFF" if result.get("power_on") is False else "unknown",
-        power_byte
-    )
+    Format (16-byte minimum):
+        Byte 0: sta - Status byte (255 = OTA mode)
+        Byte 1: mfr_hi - Manufacturer prefix (0x5A or 0x5B)
+        Byte 2: mfr_lo - Manufacturer low byte
+        Byte 3: ble_version - BLE protocol version
+        Byte 4-9: mac_address - Device MAC (6 bytes)
+        Byte 10-11: product_id - Product ID (big-endian)
+        Byte 12: firmware_ver_lo - Firmware version low byte
+        Byte 13: led_version - LED/hardware version
+        Byte 14: check_key + fw_hi - Bits 0-1: check_key, Bits 2-7: firmware high (BLE v6+)
+        Byte 15: firmware_flag - Feature flags (bits 0-4)
 
+    Format (29-byte) adds:
+        Byte 16: power - 0x23 = ON, 0x24 = OFF
+    """
+    # Devices repeat the same payload on every advertisement, so parse each
+    # distinct payload once; the result is immutable and safe to share.
+    service_data = bytes(service_data)
+    result = _parse_service_data(service_data)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _log_service_data(service_data, result)
     return result
 
 
@@ -2396,7 +2671,7 @@ def parse_v7_with_service_data(
     service_data: bytes,
     mfr_data: bytes,
     device_name: str | None = None
-) -> dict | None:
+) -> ServiceData | None:
     """
     Parse BLE v7+ advertisement with service data.
 
@@ -2411,9 +2686,9 @@ def parse_v7_with_service_data(
         mfr_data: 27+ bytes from manufacturer data AD type
 
     Returns:
-        Dict with device info and state, or None if invalid
+        ServiceData with device info and state, or None if invalid
     """
-    log_prefix = f"[{device_name}] " if device_name else ""
+    log_prefix = _make_log_prefix(device_name)
 
     # Device ID and version from service data
     device_info = parse_service_data(service_data)
@@ -2421,36 +2696,34 @@ def parse_v7_with_service_data(
         _LOGGER.debug("%sService data parsing failed", log_prefix)
         return None
 
-    ble_version = device_info["ble_version"]
+    ble_version = device_info.ble_version
 
     # For v7+, state is in manufacturer data at offset 3
     if ble_version >= 7 and len(mfr_data) >= 28:
         state_data = mfr_data[3:28]  # 25 bytes starting at offset 3
 
         # Power state is at state_data[11] (= mfr_data[14])
-        power_byte = state_data[11] & 0xFF
-        if power_byte == 0x23:
-            device_info["power_on"] = True
-        elif power_byte == 0x24:
-            device_info["power_on"] = False
-        else:
-            device_info["power_on"] = None
+        power_on = _POWER_MAP.get(state_data[11])
 
         # Mode type at state_data[12] (= mfr_data[15])
         mode_type = state_data[12] & 0xFF
         sub_mode = state_data[13] & 0xFF
 
-        device_info["state_data"] = state_data
-        device_info["mode_type"] = mode_type
-        device_info["sub_mode"] = sub_mode
-
-        _LOGGER.debug(
-            "%sBLE v7+ parsed: power=%s, mode=0x%02X, sub_mode=0x%02X",
-            log_prefix,
-            "ON" if device_info.get("power_on") else "OFF",
-            mode_type, sub_mode
+        device_info = device_info._replace(
+            power_on=power_on,
+            state_data=state_data,
+            mode_type=mode_type,
+            sub_mode=sub_mode,
         )
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%sBLE v7+ parsed: power=%s, mode=0x%02X, sub_mode=0x%02X",
+                log_prefix,
+                "ON" if power_on else "OFF",
+                mode_type, sub_mode
+            )
+
     return device_info
 
 
@@ -2474,25 +2747,22 @@ def get_service_data_from_advertisement(
     Returns:
         Service data bytes if found, or None
     """
-    # Try full UUID (0xFFFF)
-    if SERVICE_UUID_FFFF in service_data_dict:
-        return service_data_dict[SERVICE_UUID_FFFF]
-
-    # Try short UUID as string (some platforms use this format)
-    short_uuid_str = f"0000{SERVICE_UUID_SHORT:04x}-0000-1000-8000-00805f9b34fb"
-    if short_uuid_str in service_data_dict:
-        return service_data_dict[short_uuid_str]
-
-    # Try ZengGe manufacturer-specific UUIDs (0x5A00, 0x5B00)
-    # These are used by IOTBT and possibly other devices
-    for prefix in ("5a00", "5b00"):
-        uuid_str = f"0000{prefix}-0000-1000-8000-00805f9b34fb"
-        if uuid_str in service_data_dict:
-            return service_data_dict[uuid_str]
+    # Try full UUID (0xFFFF), then ZengGe manufacturer-specific UUIDs
+    # (0x5A00, 0x5B00) used by IOTBT and possibly other devices
+    for uuid_str in _SERVICE_DATA_UUIDS:
+        data = service_data_dict.get(uuid_str)
+        if data is not None:
+            return data
 
     # Try just "ffff" or "FFFF" as fallback
     for key in service_data_dict:
-        if "ffff" in key.lower():
+        is_ffff = _FFFF_KEY_CACHE.get(key)
+        if is_ffff is None:
+            is_ffff = "ffff" in key.lower()
+            if len(_FFFF_KEY_CACHE) >= _FFFF_KEY_CACHE_MAX:
+                del _FFFF_KEY_CACHE[next(iter(_FFFF_KEY_CACHE))]
+            _FFFF_KEY_CACHE[key] = is_ffff
+        if is_ffff:
             return service_data_dict[key]
 
     return None
@@ -2520,19 +2790,11 @@ def is_iotbt_segment_variant(service_data_dict: dict[str, bytes]) -> bool:
     Returns:
         True if segment-based IOTBT variant (status 0x56), False otherwise
     """
-    uuid_5a00 = "00005a00-0000-1000-8000-00805f9b34fb"
-    if uuid_5a00 not in service_data_dict:
-        return False
-
-    data = service_data_dict[uuid_5a00]
-    if len(data) < 1:
-        return False
-
     # Status byte 0x80 = standard IOTBT (Telink mesh protocol) - DEFAULT
     # Status byte 0x56 = segment-based variant
-    # Unknown values default to standard Telink for safety
-    status_byte = data[0] & 0xFF
-    return status_byte == 0x56
+    # Unknown values (or no 0x5A00 data) default to standard Telink for safety
+    data = service_data_dict.get(_SERVICE_UUID_5A00)
+    return bool(data) and data[0] == 0x56
 
 
 def is_iotbt_segment_from_manu_data(manu_data: dict[int, bytes]) -> bool:
@@ -2563,18 +2825,11 @@ def is_iotbt_segment_from_manu_data(manu_data: dict[int, bytes]) -> bool:
     if not manu_data:
         return False
 
-    ZENGGE_COMPANY_ID_MIN = 0x5A00  # 23040
-    ZENGGE_COMPANY_ID_MAX = 0x5AFF  # 23295
-    TELINK_COMPANY_ID = 0x1102      # 4354
-
-    if TELINK_COMPANY_ID in manu_data:
+    if _TELINK_COMPANY_ID in manu_data:
         # Genuine Telink BLE Mesh IOTBT - not a segment variant.
         return False
 
-    return any(
-        ZENGGE_COMPANY_ID_MIN <= cid <= ZENGGE_COMPANY_ID_MAX
-        for cid in manu_data
-    )
+    return any(cid in _LEDNET_COMPANY_ID_RANGE for cid in manu_data)
 
 
 # Bit in service-data flags2 (byte 13) that distinguishes the segment command set